@@ -0,0 +1,171 @@
+# the platform bounce curve "-math.cos(ratio) * 2" in the fixed point units of "fixed_point", sampled 1024 times per
+# platform width for hits from one width left of the platform to one width right of it. generated once with
+# "round(-math.cos((i - 1024) / 1024 * math.pi) * 2 * 1024)" and stored as data so every machine uses the same values
+bounce_table = (
+    2048, 2048, 2048, 2048, 2048, 2048, 2048, 2048, 2047, 2047, 2047, 2047, 2047, 2046, 2046, 2046, 2046, 2045, 2045,
+    2045, 2044, 2044, 2043, 2043, 2042, 2042, 2041, 2041, 2040, 2040, 2039, 2039, 2038, 2038, 2037, 2036, 2036, 2035,
+    2034, 2033, 2033, 2032, 2031, 2030, 2029, 2029, 2028, 2027, 2026, 2025, 2024, 2023, 2022, 2021, 2020, 2019, 2018,
+    2017, 2016, 2015, 2013, 2012, 2011, 2010, 2009, 2007, 2006, 2005, 2004, 2002, 2001, 2000, 1998, 1997, 1995, 1994,
+    1993, 1991, 1990, 1988, 1987, 1985, 1984, 1982, 1980, 1979, 1977, 1975, 1974, 1972, 1970, 1969, 1967, 1965, 1963,
+    1962, 1960, 1958, 1956, 1954, 1952, 1950, 1949, 1947, 1945, 1943, 1941, 1939, 1937, 1935, 1932, 1930, 1928, 1926,
+    1924, 1922, 1920, 1917, 1915, 1913, 1911, 1908, 1906, 1904, 1902, 1899, 1897, 1895, 1892, 1890, 1887, 1885, 1882,
+    1880, 1877, 1875, 1872, 1870, 1867, 1865, 1862, 1859, 1857, 1854, 1851, 1849, 1846, 1843, 1840, 1838, 1835, 1832,
+    1829, 1826, 1824, 1821, 1818, 1815, 1812, 1809, 1806, 1803, 1800, 1797, 1794, 1791, 1788, 1785, 1782, 1779, 1776,
+    1773, 1769, 1766, 1763, 1760, 1757, 1753, 1750, 1747, 1744, 1740, 1737, 1734, 1730, 1727, 1724, 1720, 1717, 1713,
+    1710, 1706, 1703, 1699, 1696, 1692, 1689, 1685, 1682, 1678, 1674, 1671, 1667, 1663, 1660, 1656, 1652, 1649, 1645,
+    1641, 1637, 1634, 1630, 1626, 1622, 1618, 1615, 1611, 1607, 1603, 1599, 1595, 1591, 1587, 1583, 1579, 1575, 1571,
+    1567, 1563, 1559, 1555, 1551, 1547, 1543, 1538, 1534, 1530, 1526, 1522, 1517, 1513, 1509, 1505, 1500, 1496, 1492,
+    1488, 1483, 1479, 1475, 1470, 1466, 1461, 1457, 1453, 1448, 1444, 1439, 1435, 1430, 1426, 1421, 1417, 1412, 1408,
+    1403, 1398, 1394, 1389, 1385, 1380, 1375, 1371, 1366, 1361, 1357, 1352, 1347, 1342, 1338, 1333, 1328, 1323, 1319,
+    1314, 1309, 1304, 1299, 1294, 1289, 1285, 1280, 1275, 1270, 1265, 1260, 1255, 1250, 1245, 1240, 1235, 1230, 1225,
+    1220, 1215, 1210, 1205, 1200, 1195, 1190, 1184, 1179, 1174, 1169, 1164, 1159, 1153, 1148, 1143, 1138, 1133, 1127,
+    1122, 1117, 1112, 1106, 1101, 1096, 1090, 1085, 1080, 1074, 1069, 1064, 1058, 1053, 1047, 1042, 1037, 1031, 1026,
+    1020, 1015, 1009, 1004, 999, 993, 988, 982, 976, 971, 965, 960, 954, 949, 943, 938, 932, 926, 921, 915, 910, 904,
+    898, 893, 887, 881, 876, 870, 864, 859, 853, 847, 841, 836, 830, 824, 818, 813, 807, 801, 795, 790, 784, 778, 772,
+    766, 760, 755, 749, 743, 737, 731, 725, 719, 714, 708, 702, 696, 690, 684, 678, 672, 666, 660, 654, 648, 642, 636,
+    630, 624, 619, 613, 607, 601, 595, 588, 582, 576, 570, 564, 558, 552, 546, 540, 534, 528, 522, 516, 510, 504, 498,
+    492, 485, 479, 473, 467, 461, 455, 449, 443, 436, 430, 424, 418, 412, 406, 400, 393, 387, 381, 375, 369, 363, 356,
+    350, 344, 338, 332, 325, 319, 313, 307, 301, 294, 288, 282, 276, 269, 263, 257, 251, 244, 238, 232, 226, 219, 213,
+    207, 201, 194, 188, 182, 176, 169, 163, 157, 151, 144, 138, 132, 126, 119, 113, 107, 100, 94, 88, 82, 75, 69, 63,
+    57, 50, 44, 38, 31, 25, 19, 13, 6, 0, -6, -13, -19, -25, -31, -38, -44, -50, -57, -63, -69, -75, -82, -88, -94,
+    -100, -107, -113, -119, -126, -132, -138, -144, -151, -157, -163, -169, -176, -182, -188, -194, -201, -207, -213,
+    -219, -226, -232, -238, -244, -251, -257, -263, -269, -276, -282, -288, -294, -301, -307, -313, -319, -325, -332,
+    -338, -344, -350, -356, -363, -369, -375, -381, -387, -393, -400, -406, -412, -418, -424, -430, -436, -443, -449,
+    -455, -461, -467, -473, -479, -485, -492, -498, -504, -510, -516, -522, -528, -534, -540, -546, -552, -558, -564,
+    -570, -576, -582, -588, -595, -601, -607, -613, -619, -624, -630, -636, -642, -648, -654, -660, -666, -672, -678,
+    -684, -690, -696, -702, -708, -714, -719, -725, -731, -737, -743, -749, -755, -760, -766, -772, -778, -784, -790,
+    -795, -801, -807, -813, -818, -824, -830, -836, -841, -847, -853, -859, -864, -870, -876, -881, -887, -893, -898,
+    -904, -910, -915, -921, -926, -932, -938, -943, -949, -954, -960, -965, -971, -976, -982, -988, -993, -999, -1004,
+    -1009, -1015, -1020, -1026, -1031, -1037, -1042, -1047, -1053, -1058, -1064, -1069, -1074, -1080, -1085, -1090,
+    -1096, -1101, -1106, -1112, -1117, -1122, -1127, -1133, -1138, -1143, -1148, -1153, -1159, -1164, -1169, -1174,
+    -1179, -1184, -1190, -1195, -1200, -1205, -1210, -1215, -1220, -1225, -1230, -1235, -1240, -1245, -1250, -1255,
+    -1260, -1265, -1270, -1275, -1280, -1285, -1289, -1294, -1299, -1304, -1309, -1314, -1319, -1323, -1328, -1333,
+    -1338, -1342, -1347, -1352, -1357, -1361, -1366, -1371, -1375, -1380, -1385, -1389, -1394, -1398, -1403, -1408,
+    -1412, -1417, -1421, -1426, -1430, -1435, -1439, -1444, -1448, -1453, -1457, -1461, -1466, -1470, -1475, -1479,
+    -1483, -1488, -1492, -1496, -1500, -1505, -1509, -1513, -1517, -1522, -1526, -1530, -1534, -1538, -1543, -1547,
+    -1551, -1555, -1559, -1563, -1567, -1571, -1575, -1579, -1583, -1587, -1591, -1595, -1599, -1603, -1607, -1611,
+    -1615, -1618, -1622, -1626, -1630, -1634, -1637, -1641, -1645, -1649, -1652, -1656, -1660, -1663, -1667, -1671,
+    -1674, -1678, -1682, -1685, -1689, -1692, -1696, -1699, -1703, -1706, -1710, -1713, -1717, -1720, -1724, -1727,
+    -1730, -1734, -1737, -1740, -1744, -1747, -1750, -1753, -1757, -1760, -1763, -1766, -1769, -1773, -1776, -1779,
+    -1782, -1785, -1788, -1791, -1794, -1797, -1800, -1803, -1806, -1809, -1812, -1815, -1818, -1821, -1824, -1826,
+    -1829, -1832, -1835, -1838, -1840, -1843, -1846, -1849, -1851, -1854, -1857, -1859, -1862, -1865, -1867, -1870,
+    -1872, -1875, -1877, -1880, -1882, -1885, -1887, -1890, -1892, -1895, -1897, -1899, -1902, -1904, -1906, -1908,
+    -1911, -1913, -1915, -1917, -1920, -1922, -1924, -1926, -1928, -1930, -1932, -1935, -1937, -1939, -1941, -1943,
+    -1945, -1947, -1949, -1950, -1952, -1954, -1956, -1958, -1960, -1962, -1963, -1965, -1967, -1969, -1970, -1972,
+    -1974, -1975, -1977, -1979, -1980, -1982, -1984, -1985, -1987, -1988, -1990, -1991, -1993, -1994, -1995, -1997,
+    -1998, -2000, -2001, -2002, -2004, -2005, -2006, -2007, -2009, -2010, -2011, -2012, -2013, -2015, -2016, -2017,
+    -2018, -2019, -2020, -2021, -2022, -2023, -2024, -2025, -2026, -2027, -2028, -2029, -2029, -2030, -2031, -2032,
+    -2033, -2033, -2034, -2035, -2036, -2036, -2037, -2038, -2038, -2039, -2039, -2040, -2040, -2041, -2041, -2042,
+    -2042, -2043, -2043, -2044, -2044, -2045, -2045, -2045, -2046, -2046, -2046, -2046, -2047, -2047, -2047, -2047,
+    -2047, -2048, -2048, -2048, -2048, -2048, -2048, -2048, -2048, -2048, -2048, -2048, -2048, -2048, -2048, -2048,
+    -2047, -2047, -2047, -2047, -2047, -2046, -2046, -2046, -2046, -2045, -2045, -2045, -2044, -2044, -2043, -2043,
+    -2042, -2042, -2041, -2041, -2040, -2040, -2039, -2039, -2038, -2038, -2037, -2036, -2036, -2035, -2034, -2033,
+    -2033, -2032, -2031, -2030, -2029, -2029, -2028, -2027, -2026, -2025, -2024, -2023, -2022, -2021, -2020, -2019,
+    -2018, -2017, -2016, -2015, -2013, -2012, -2011, -2010, -2009, -2007, -2006, -2005, -2004, -2002, -2001, -2000,
+    -1998, -1997, -1995, -1994, -1993, -1991, -1990, -1988, -1987, -1985, -1984, -1982, -1980, -1979, -1977, -1975,
+    -1974, -1972, -1970, -1969, -1967, -1965, -1963, -1962, -1960, -1958, -1956, -1954, -1952, -1950, -1949, -1947,
+    -1945, -1943, -1941, -1939, -1937, -1935, -1932, -1930, -1928, -1926, -1924, -1922, -1920, -1917, -1915, -1913,
+    -1911, -1908, -1906, -1904, -1902, -1899, -1897, -1895, -1892, -1890, -1887, -1885, -1882, -1880, -1877, -1875,
+    -1872, -1870, -1867, -1865, -1862, -1859, -1857, -1854, -1851, -1849, -1846, -1843, -1840, -1838, -1835, -1832,
+    -1829, -1826, -1824, -1821, -1818, -1815, -1812, -1809, -1806, -1803, -1800, -1797, -1794, -1791, -1788, -1785,
+    -1782, -1779, -1776, -1773, -1769, -1766, -1763, -1760, -1757, -1753, -1750, -1747, -1744, -1740, -1737, -1734,
+    -1730, -1727, -1724, -1720, -1717, -1713, -1710, -1706, -1703, -1699, -1696, -1692, -1689, -1685, -1682, -1678,
+    -1674, -1671, -1667, -1663, -1660, -1656, -1652, -1649, -1645, -1641, -1637, -1634, -1630, -1626, -1622, -1618,
+    -1615, -1611, -1607, -1603, -1599, -1595, -1591, -1587, -1583, -1579, -1575, -1571, -1567, -1563, -1559, -1555,
+    -1551, -1547, -1543, -1538, -1534, -1530, -1526, -1522, -1517, -1513, -1509, -1505, -1500, -1496, -1492, -1488,
+    -1483, -1479, -1475, -1470, -1466, -1461, -1457, -1453, -1448, -1444, -1439, -1435, -1430, -1426, -1421, -1417,
+    -1412, -1408, -1403, -1398, -1394, -1389, -1385, -1380, -1375, -1371, -1366, -1361, -1357, -1352, -1347, -1342,
+    -1338, -1333, -1328, -1323, -1319, -1314, -1309, -1304, -1299, -1294, -1289, -1285, -1280, -1275, -1270, -1265,
+    -1260, -1255, -1250, -1245, -1240, -1235, -1230, -1225, -1220, -1215, -1210, -1205, -1200, -1195, -1190, -1184,
+    -1179, -1174, -1169, -1164, -1159, -1153, -1148, -1143, -1138, -1133, -1127, -1122, -1117, -1112, -1106, -1101,
+    -1096, -1090, -1085, -1080, -1074, -1069, -1064, -1058, -1053, -1047, -1042, -1037, -1031, -1026, -1020, -1015,
+    -1009, -1004, -999, -993, -988, -982, -976, -971, -965, -960, -954, -949, -943, -938, -932, -926, -921, -915, -910,
+    -904, -898, -893, -887, -881, -876, -870, -864, -859, -853, -847, -841, -836, -830, -824, -818, -813, -807, -801,
+    -795, -790, -784, -778, -772, -766, -760, -755, -749, -743, -737, -731, -725, -719, -714, -708, -702, -696, -690,
+    -684, -678, -672, -666, -660, -654, -648, -642, -636, -630, -624, -619, -613, -607, -601, -595, -588, -582, -576,
+    -570, -564, -558, -552, -546, -540, -534, -528, -522, -516, -510, -504, -498, -492, -485, -479, -473, -467, -461,
+    -455, -449, -443, -436, -430, -424, -418, -412, -406, -400, -393, -387, -381, -375, -369, -363, -356, -350, -344,
+    -338, -332, -325, -319, -313, -307, -301, -294, -288, -282, -276, -269, -263, -257, -251, -244, -238, -232, -226,
+    -219, -213, -207, -201, -194, -188, -182, -176, -169, -163, -157, -151, -144, -138, -132, -126, -119, -113, -107,
+    -100, -94, -88, -82, -75, -69, -63, -57, -50, -44, -38, -31, -25, -19, -13, -6, 0, 6, 13, 19, 25, 31, 38, 44, 50,
+    57, 63, 69, 75, 82, 88, 94, 100, 107, 113, 119, 126, 132, 138, 144, 151, 157, 163, 169, 176, 182, 188, 194, 201,
+    207, 213, 219, 226, 232, 238, 244, 251, 257, 263, 269, 276, 282, 288, 294, 301, 307, 313, 319, 325, 332, 338, 344,
+    350, 356, 363, 369, 375, 381, 387, 393, 400, 406, 412, 418, 424, 430, 436, 443, 449, 455, 461, 467, 473, 479, 485,
+    492, 498, 504, 510, 516, 522, 528, 534, 540, 546, 552, 558, 564, 570, 576, 582, 588, 595, 601, 607, 613, 619, 624,
+    630, 636, 642, 648, 654, 660, 666, 672, 678, 684, 690, 696, 702, 708, 714, 719, 725, 731, 737, 743, 749, 755, 760,
+    766, 772, 778, 784, 790, 795, 801, 807, 813, 818, 824, 830, 836, 841, 847, 853, 859, 864, 870, 876, 881, 887, 893,
+    898, 904, 910, 915, 921, 926, 932, 938, 943, 949, 954, 960, 965, 971, 976, 982, 988, 993, 999, 1004, 1009, 1015,
+    1020, 1026, 1031, 1037, 1042, 1047, 1053, 1058, 1064, 1069, 1074, 1080, 1085, 1090, 1096, 1101, 1106, 1112, 1117,
+    1122, 1127, 1133, 1138, 1143, 1148, 1153, 1159, 1164, 1169, 1174, 1179, 1184, 1190, 1195, 1200, 1205, 1210, 1215,
+    1220, 1225, 1230, 1235, 1240, 1245, 1250, 1255, 1260, 1265, 1270, 1275, 1280, 1285, 1289, 1294, 1299, 1304, 1309,
+    1314, 1319, 1323, 1328, 1333, 1338, 1342, 1347, 1352, 1357, 1361, 1366, 1371, 1375, 1380, 1385, 1389, 1394, 1398,
+    1403, 1408, 1412, 1417, 1421, 1426, 1430, 1435, 1439, 1444, 1448, 1453, 1457, 1461, 1466, 1470, 1475, 1479, 1483,
+    1488, 1492, 1496, 1500, 1505, 1509, 1513, 1517, 1522, 1526, 1530, 1534, 1538, 1543, 1547, 1551, 1555, 1559, 1563,
+    1567, 1571, 1575, 1579, 1583, 1587, 1591, 1595, 1599, 1603, 1607, 1611, 1615, 1618, 1622, 1626, 1630, 1634, 1637,
+    1641, 1645, 1649, 1652, 1656, 1660, 1663, 1667, 1671, 1674, 1678, 1682, 1685, 1689, 1692, 1696, 1699, 1703, 1706,
+    1710, 1713, 1717, 1720, 1724, 1727, 1730, 1734, 1737, 1740, 1744, 1747, 1750, 1753, 1757, 1760, 1763, 1766, 1769,
+    1773, 1776, 1779, 1782, 1785, 1788, 1791, 1794, 1797, 1800, 1803, 1806, 1809, 1812, 1815, 1818, 1821, 1824, 1826,
+    1829, 1832, 1835, 1838, 1840, 1843, 1846, 1849, 1851, 1854, 1857, 1859, 1862, 1865, 1867, 1870, 1872, 1875, 1877,
+    1880, 1882, 1885, 1887, 1890, 1892, 1895, 1897, 1899, 1902, 1904, 1906, 1908, 1911, 1913, 1915, 1917, 1920, 1922,
+    1924, 1926, 1928, 1930, 1932, 1935, 1937, 1939, 1941, 1943, 1945, 1947, 1949, 1950, 1952, 1954, 1956, 1958, 1960,
+    1962, 1963, 1965, 1967, 1969, 1970, 1972, 1974, 1975, 1977, 1979, 1980, 1982, 1984, 1985, 1987, 1988, 1990, 1991,
+    1993, 1994, 1995, 1997, 1998, 2000, 2001, 2002, 2004, 2005, 2006, 2007, 2009, 2010, 2011, 2012, 2013, 2015, 2016,
+    2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025, 2026, 2027, 2028, 2029, 2029, 2030, 2031, 2032, 2033, 2033,
+    2034, 2035, 2036, 2036, 2037, 2038, 2038, 2039, 2039, 2040, 2040, 2041, 2041, 2042, 2042, 2043, 2043, 2044, 2044,
+    2045, 2045, 2045, 2046, 2046, 2046, 2046, 2047, 2047, 2047, 2047, 2047, 2048, 2048, 2048, 2048, 2048, 2048, 2048,
+    2048, 2048, 2048, 2048, 2048, 2048, 2048, 2048, 2047, 2047, 2047, 2047, 2047, 2046, 2046, 2046, 2046, 2045, 2045,
+    2045, 2044, 2044, 2043, 2043, 2042, 2042, 2041, 2041, 2040, 2040, 2039, 2039, 2038, 2038, 2037, 2036, 2036, 2035,
+    2034, 2033, 2033, 2032, 2031, 2030, 2029, 2029, 2028, 2027, 2026, 2025, 2024, 2023, 2022, 2021, 2020, 2019, 2018,
+    2017, 2016, 2015, 2013, 2012, 2011, 2010, 2009, 2007, 2006, 2005, 2004, 2002, 2001, 2000, 1998, 1997, 1995, 1994,
+    1993, 1991, 1990, 1988, 1987, 1985, 1984, 1982, 1980, 1979, 1977, 1975, 1974, 1972, 1970, 1969, 1967, 1965, 1963,
+    1962, 1960, 1958, 1956, 1954, 1952, 1950, 1949, 1947, 1945, 1943, 1941, 1939, 1937, 1935, 1932, 1930, 1928, 1926,
+    1924, 1922, 1920, 1917, 1915, 1913, 1911, 1908, 1906, 1904, 1902, 1899, 1897, 1895, 1892, 1890, 1887, 1885, 1882,
+    1880, 1877, 1875, 1872, 1870, 1867, 1865, 1862, 1859, 1857, 1854, 1851, 1849, 1846, 1843, 1840, 1838, 1835, 1832,
+    1829, 1826, 1824, 1821, 1818, 1815, 1812, 1809, 1806, 1803, 1800, 1797, 1794, 1791, 1788, 1785, 1782, 1779, 1776,
+    1773, 1769, 1766, 1763, 1760, 1757, 1753, 1750, 1747, 1744, 1740, 1737, 1734, 1730, 1727, 1724, 1720, 1717, 1713,
+    1710, 1706, 1703, 1699, 1696, 1692, 1689, 1685, 1682, 1678, 1674, 1671, 1667, 1663, 1660, 1656, 1652, 1649, 1645,
+    1641, 1637, 1634, 1630, 1626, 1622, 1618, 1615, 1611, 1607, 1603, 1599, 1595, 1591, 1587, 1583, 1579, 1575, 1571,
+    1567, 1563, 1559, 1555, 1551, 1547, 1543, 1538, 1534, 1530, 1526, 1522, 1517, 1513, 1509, 1505, 1500, 1496, 1492,
+    1488, 1483, 1479, 1475, 1470, 1466, 1461, 1457, 1453, 1448, 1444, 1439, 1435, 1430, 1426, 1421, 1417, 1412, 1408,
+    1403, 1398, 1394, 1389, 1385, 1380, 1375, 1371, 1366, 1361, 1357, 1352, 1347, 1342, 1338, 1333, 1328, 1323, 1319,
+    1314, 1309, 1304, 1299, 1294, 1289, 1285, 1280, 1275, 1270, 1265, 1260, 1255, 1250, 1245, 1240, 1235, 1230, 1225,
+    1220, 1215, 1210, 1205, 1200, 1195, 1190, 1184, 1179, 1174, 1169, 1164, 1159, 1153, 1148, 1143, 1138, 1133, 1127,
+    1122, 1117, 1112, 1106, 1101, 1096, 1090, 1085, 1080, 1074, 1069, 1064, 1058, 1053, 1047, 1042, 1037, 1031, 1026,
+    1020, 1015, 1009, 1004, 999, 993, 988, 982, 976, 971, 965, 960, 954, 949, 943, 938, 932, 926, 921, 915, 910, 904,
+    898, 893, 887, 881, 876, 870, 864, 859, 853, 847, 841, 836, 830, 824, 818, 813, 807, 801, 795, 790, 784, 778, 772,
+    766, 760, 755, 749, 743, 737, 731, 725, 719, 714, 708, 702, 696, 690, 684, 678, 672, 666, 660, 654, 648, 642, 636,
+    630, 624, 619, 613, 607, 601, 595, 588, 582, 576, 570, 564, 558, 552, 546, 540, 534, 528, 522, 516, 510, 504, 498,
+    492, 485, 479, 473, 467, 461, 455, 449, 443, 436, 430, 424, 418, 412, 406, 400, 393, 387, 381, 375, 369, 363, 356,
+    350, 344, 338, 332, 325, 319, 313, 307, 301, 294, 288, 282, 276, 269, 263, 257, 251, 244, 238, 232, 226, 219, 213,
+    207, 201, 194, 188, 182, 176, 169, 163, 157, 151, 144, 138, 132, 126, 119, 113, 107, 100, 94, 88, 82, 75, 69, 63,
+    57, 50, 44, 38, 31, 25, 19, 13, 6, 0, -6, -13, -19, -25, -31, -38, -44, -50, -57, -63, -69, -75, -82, -88, -94,
+    -100, -107, -113, -119, -126, -132, -138, -144, -151, -157, -163, -169, -176, -182, -188, -194, -201, -207, -213,
+    -219, -226, -232, -238, -244, -251, -257, -263, -269, -276, -282, -288, -294, -301, -307, -313, -319, -325, -332,
+    -338, -344, -350, -356, -363, -369, -375, -381, -387, -393, -400, -406, -412, -418, -424, -430, -436, -443, -449,
+    -455, -461, -467, -473, -479, -485, -492, -498, -504, -510, -516, -522, -528, -534, -540, -546, -552, -558, -564,
+    -570, -576, -582, -588, -595, -601, -607, -613, -619, -624, -630, -636, -642, -648, -654, -660, -666, -672, -678,
+    -684, -690, -696, -702, -708, -714, -719, -725, -731, -737, -743, -749, -755, -760, -766, -772, -778, -784, -790,
+    -795, -801, -807, -813, -818, -824, -830, -836, -841, -847, -853, -859, -864, -870, -876, -881, -887, -893, -898,
+    -904, -910, -915, -921, -926, -932, -938, -943, -949, -954, -960, -965, -971, -976, -982, -988, -993, -999, -1004,
+    -1009, -1015, -1020, -1026, -1031, -1037, -1042, -1047, -1053, -1058, -1064, -1069, -1074, -1080, -1085, -1090,
+    -1096, -1101, -1106, -1112, -1117, -1122, -1127, -1133, -1138, -1143, -1148, -1153, -1159, -1164, -1169, -1174,
+    -1179, -1184, -1190, -1195, -1200, -1205, -1210, -1215, -1220, -1225, -1230, -1235, -1240, -1245, -1250, -1255,
+    -1260, -1265, -1270, -1275, -1280, -1285, -1289, -1294, -1299, -1304, -1309, -1314, -1319, -1323, -1328, -1333,
+    -1338, -1342, -1347, -1352, -1357, -1361, -1366, -1371, -1375, -1380, -1385, -1389, -1394, -1398, -1403, -1408,
+    -1412, -1417, -1421, -1426, -1430, -1435, -1439, -1444, -1448, -1453, -1457, -1461, -1466, -1470, -1475, -1479,
+    -1483, -1488, -1492, -1496, -1500, -1505, -1509, -1513, -1517, -1522, -1526, -1530, -1534, -1538, -1543, -1547,
+    -1551, -1555, -1559, -1563, -1567, -1571, -1575, -1579, -1583, -1587, -1591, -1595, -1599, -1603, -1607, -1611,
+    -1615, -1618, -1622, -1626, -1630, -1634, -1637, -1641, -1645, -1649, -1652, -1656, -1660, -1663, -1667, -1671,
+    -1674, -1678, -1682, -1685, -1689, -1692, -1696, -1699, -1703, -1706, -1710, -1713, -1717, -1720, -1724, -1727,
+    -1730, -1734, -1737, -1740, -1744, -1747, -1750, -1753, -1757, -1760, -1763, -1766, -1769, -1773, -1776, -1779,
+    -1782, -1785, -1788, -1791, -1794, -1797, -1800, -1803, -1806, -1809, -1812, -1815, -1818, -1821, -1824, -1826,
+    -1829, -1832, -1835, -1838, -1840, -1843, -1846, -1849, -1851, -1854, -1857, -1859, -1862, -1865, -1867, -1870,
+    -1872, -1875, -1877, -1880, -1882, -1885, -1887, -1890, -1892, -1895, -1897, -1899, -1902, -1904, -1906, -1908,
+    -1911, -1913, -1915, -1917, -1920, -1922, -1924, -1926, -1928, -1930, -1932, -1935, -1937, -1939, -1941, -1943,
+    -1945, -1947, -1949, -1950, -1952, -1954, -1956, -1958, -1960, -1962, -1963, -1965, -1967, -1969, -1970, -1972,
+    -1974, -1975, -1977, -1979, -1980, -1982, -1984, -1985, -1987, -1988, -1990, -1991, -1993, -1994, -1995, -1997,
+    -1998, -2000, -2001, -2002, -2004, -2005, -2006, -2007, -2009, -2010, -2011, -2012, -2013, -2015, -2016, -2017,
+    -2018, -2019, -2020, -2021, -2022, -2023, -2024, -2025, -2026, -2027, -2028, -2029, -2029, -2030, -2031, -2032,
+    -2033, -2033, -2034, -2035, -2036, -2036, -2037, -2038, -2038, -2039, -2039, -2040, -2040, -2041, -2041, -2042,
+    -2042, -2043, -2043, -2044, -2044, -2045, -2045, -2045, -2046, -2046, -2046, -2046, -2047, -2047, -2047, -2047,
+    -2047, -2048, -2048, -2048, -2048, -2048, -2048, -2048, -2048)
@@ -0,0 +1,286 @@
+# import libraries
+import math
+import random
+import time
+import numpy
+import pygame
+import bounce_curve
+import physics
+
+# fixed point variables. positions and velocities are stored as integers in 1/1024ths of a pixel
+shift = 10
+scale = 1 << shift
+half = scale // 2
+ball_radius = physics.ball_radius * scale
+screen_width = physics.screen_dimensions[0] * scale
+screen_height = physics.screen_dimensions[1] * scale
+min_x_vel = scale // 10     # "get_new_vel" treats x velocities under .1 as vertical
+
+# the platform bounce curve "-math.cos(ratio) * 2" sampled "bounce_steps" times per platform width, for hits from one
+# width left of the platform to one width right of it. the table is stored as data in "bounce_curve" so it never
+# depends on the machine's "math.cos"
+bounce_steps = 1024
+bounce_table = bounce_curve.bounce_table
+bounce_array = numpy.array(bounce_table, numpy.int32)
+
+
+def to_fixed(value: int | float):
+    return round(value * scale)
+
+
+# converts a fixed point coordinate to the nearest pixel, rounding halves away from zero like pygame.Rect does
+def to_pixels(value: int):
+    if value < 0:
+        return -((-value + half) // scale)
+    return (value + half) // scale
+
+
+# returns the x velocity of a ball that hits the platform "offset" fixed point units right of its left edge
+def bounce_velocity(offset: int, width: int):
+    index = offset * bounce_steps // width + bounce_steps
+    return bounce_table[min(max(index, 0), 3 * bounce_steps)]
+
+
+# the same as "bounce_velocity" for arrays of offsets and widths
+def bounce_velocities(offset: numpy.ndarray, width: numpy.ndarray):
+    index = offset.astype(numpy.int64) * bounce_steps // width + bounce_steps
+    return bounce_array[numpy.clip(index, 0, 3 * bounce_steps)]
+
+
+# returns 1 if "m * dx" is greater than "dy" for the slope m = y_vel / x_vel, -1 if it is smaller and 0 if they are
+# equal. multiplying through by x_vel keeps the comparison exact
+def compare_slope(x_vel: int, y_vel: int, dx: int, dy: int):
+    return physics.normalize((y_vel * dx - dy * x_vel) * physics.normalize(x_vel))
+
+
+# a ball with the same interface as "physics.Ball" that moves in integer fixed point steps, so its trajectory is the
+# same on every machine. "x", "y", "x_vel" and "y_vel" are converted to and from pixels for the rest of the game
+class FixedBall:
+    # FixedBall constructor
+    def __init__(self, x: int | float, y: int | float, x_vel: int | float, y_vel: int | float, color: tuple = None):
+        self.fx = to_fixed(x)
+        self.fy = to_fixed(y)
+        self.fx_vel = to_fixed(x_vel)
+        self.fy_vel = to_fixed(y_vel)
+        self.rect = pygame.Rect([0, 0], [2 * physics.ball_radius, 2 * physics.ball_radius])
+        self.rect.center = (to_pixels(self.fx), to_pixels(self.fy))
+        if color is None:
+            self.color = (255, 0, 0)
+        else:
+            self.color = color
+
+    @property
+    def x(self):
+        return self.fx / scale
+
+    @x.setter
+    def x(self, value):
+        self.fx = to_fixed(value)
+
+    @property
+    def y(self):
+        return self.fy / scale
+
+    @y.setter
+    def y(self, value):
+        self.fy = to_fixed(value)
+
+    @property
+    def x_vel(self):
+        return self.fx_vel / scale
+
+    @x_vel.setter
+    def x_vel(self, value):
+        self.fx_vel = to_fixed(value)
+
+    @property
+    def y_vel(self):
+        return self.fy_vel / scale
+
+    @y_vel.setter
+    def y_vel(self, value):
+        self.fy_vel = to_fixed(value)
+
+    # handles the collision of the ball against a rectangle on the screen and decides how to bounce the ball.
+    def handle_rect_bounce(self, rect, object_hit="brick"):
+        norm_cords = [-1 if self.fx < rect.centerx * scale else 1, -1 if self.fy < rect.centery * scale else 1]
+        self.fx_vel, self.fy_vel = get_new_vel(self, norm_cords, rect, object_hit)
+
+    def set_pos(self, fx: int, fy: int):
+        self.fx = fx
+        self.fy = fy
+
+        if self.fx - ball_radius < 0:
+            self.fx = ball_radius
+            self.fx_vel *= -1
+        if self.fx + ball_radius > screen_width:
+            self.fx = screen_width - ball_radius
+            self.fx_vel *= -1
+        if self.fy - ball_radius < 0:
+            self.fy = ball_radius
+            self.fy_vel *= -1
+        if self.fy + ball_radius > screen_height:
+            self.fy = screen_height - ball_radius
+            self.fy_vel *= -1
+
+        # the ball is always on the screen here, so rounding only has to handle positive coordinates
+        self.rect.center = ((self.fx + half) >> shift, (self.fy + half) >> shift)
+
+    # updates the ball's position according to it's speed
+    def update_pos(self):
+        self.fx += self.fx_vel
+        self.fy += self.fy_vel
+
+        # puts the ball back on the screen and bounces it if the ball has hit a wall
+        if self.fx - ball_radius < 0:
+            self.fx = ball_radius
+            self.fx_vel *= -1
+        if self.fx + ball_radius > screen_width:
+            self.fx = screen_width - ball_radius
+            self.fx_vel *= -1
+        if self.fy - ball_radius < 0:
+            self.fy = ball_radius
+            self.fy_vel *= -1
+
+        # the ball is always on the screen here, so rounding only has to handle positive coordinates
+        self.rect.center = ((self.fx + half) >> shift, (self.fy + half) >> shift)
+
+    # draws the ball on the screen
+    def draw(self, surface: pygame.Surface):
+        pygame.draw.circle(surface, self.color, [self.x, self.y], physics.ball_radius)
+
+
+# the fixed point version of "physics.get_new_vel". returns the new fixed point velocity of the ball
+def get_new_vel(ball: FixedBall, norm_cords, rect, object_hit):
+    left, right, top, bottom = rect.left * scale, rect.right * scale, rect.top * scale, rect.bottom * scale
+    if object_hit == "platform":
+        ball.fx_vel = bounce_velocity(ball.fx - left, rect.width * scale)
+    norm_vel_cords = [physics.normalize(ball.fx_vel), physics.normalize(ball.fy_vel)]
+    dist_arr = [0 if norm_vel_cords[i] == norm_cords[i] else 1 for i in range(len(norm_cords))]
+    match sum(dist_arr):
+        case 0:
+            if norm_cords[0] == -1:
+                ball.set_pos(left - ball_radius, ball.fy)
+            else:
+                ball.set_pos(right + ball_radius, ball.fy)
+            return [norm_vel_cords[0] * abs(ball.fx_vel), ball.fy_vel]
+        case 1:
+            if dist_arr[0] == 1:
+                if norm_cords[0] == -1:
+                    ball.set_pos(left - ball_radius, ball.fy)
+                else:
+                    ball.set_pos(right + ball_radius, ball.fy)
+                return [-norm_vel_cords[0] * abs(ball.fx_vel), ball.fy_vel]
+            else:
+                if norm_cords[1] == -1:
+                    ball.set_pos(ball.fx, top - ball_radius)
+                else:
+                    ball.set_pos(ball.fx, bottom + ball_radius)
+                return [ball.fx_vel, -norm_vel_cords[1] * abs(ball.fy_vel)]
+        case 2:
+            if abs(ball.fx_vel) <= min_x_vel:
+                if norm_vel_cords[1] == 1:
+                    ball.set_pos(ball.fx, top - ball_radius)
+                    return [ball.fx_vel, -abs(ball.fy_vel)]
+                else:
+                    ball.set_pos(ball.fx, bottom + ball_radius)
+                    return [ball.fx_vel, abs(ball.fy_vel)]
+
+            match norm_vel_cords:
+                case [1, 1]:
+                    if compare_slope(ball.fx_vel, ball.fy_vel, left - ball.fx, top - ball.fy) == 1:
+                        ball.set_pos(left - ball_radius, ball.fy)
+                        return [-abs(ball.fx_vel), ball.fy_vel]
+                    else:
+                        ball.set_pos(ball.fx, top - ball_radius)
+                        return [ball.fx_vel, -abs(ball.fy_vel)]
+                case [-1, 1]:
+                    if compare_slope(ball.fx_vel, ball.fy_vel, right - ball.fx, top - ball.fy) == -1:
+                        ball.set_pos(ball.fx, top - ball_radius)
+                        return [ball.fx_vel, -abs(ball.fy_vel)]
+                    else:
+                        ball.set_pos(right + ball_radius, ball.fy)
+                        return [abs(ball.fx_vel), ball.fy_vel]
+                case [1, -1]:
+                    if compare_slope(ball.fx_vel, ball.fy_vel, left - ball.fx, bottom - ball.fy) == 1:
+                        ball.set_pos(ball.fx, bottom + ball_radius)
+                        return [ball.fx_vel, abs(ball.fy_vel)]
+                    else:
+                        ball.set_pos(left - ball_radius, ball.fy)
+                        return [-abs(ball.fx_vel), ball.fy_vel]
+                case [-1, -1]:
+                    if compare_slope(ball.fx_vel, ball.fy_vel, right - ball.fx, bottom - ball.fy) == 1:
+                        ball.set_pos(ball.fx, bottom + ball_radius)
+                        return [ball.fx_vel, abs(ball.fy_vel)]
+                    else:
+                        ball.set_pos(right + ball_radius, ball.fy)
+                        return [abs(ball.fx_vel), ball.fy_vel]
+
+
+# advances a ball one frame between the walls, a platform and bricks that bounce the ball but are not destroyed, and
+# returns what it hit
+def step_ball(ball, platform: pygame.Rect, bricks: list):
+    ball.update_pos()
+    hit = None
+    if ball.rect.colliderect(platform):
+        ball.handle_rect_bounce(platform, "platform")
+        hit = "platform"
+    for i, brick in enumerate(bricks):
+        if brick.colliderect(ball.rect):
+            ball.handle_rect_bounce(brick)
+            hit = i
+            break
+    return hit
+
+
+# checks the fixed point backend against the float "physics.Ball". balls are started from the same random states
+# around the platform and a brick and stepped one frame with each backend. the resulting positions and velocities have
+# to agree within "tolerance" pixels (and pixels per frame). a state that sits on a rounding boundary can make the two
+# backends hit different objects, so up to "max_mismatches" of the trials are allowed to disagree on what was hit.
+# over many frames the differences add up like any change in rounding would, so whole trajectories are not compared
+def conformance_check(trials: int = 20000, tolerance: float = 0.01, max_mismatches: float = 0.01, seed: int = 0):
+    rng = random.Random(seed)
+    platform = pygame.Rect(175, 703, 50, 10)
+    bricks = [pygame.Rect(151, 201, 48, 15)]
+    worst = 0
+    mismatches = 0
+    for trial in range(trials):
+        target = platform if trial % 2 == 0 else bricks[0]
+        x = rng.uniform(target.left - 12, target.right + 12)
+        y = rng.uniform(target.top - 12, target.bottom + 12)
+        angle = rng.uniform(0, 2 * math.pi)
+        args = (x, y, math.cos(angle) * 6, math.sin(angle) * 6)
+
+        float_ball = physics.Ball(*args)
+        fixed_ball = FixedBall(*args)
+        if step_ball(float_ball, platform, bricks) != step_ball(fixed_ball, platform, bricks):
+            mismatches += 1
+            continue
+        worst = max(worst, abs(float_ball.x - fixed_ball.x), abs(float_ball.y - fixed_ball.y),
+                    abs(float_ball.x_vel - fixed_ball.x_vel), abs(float_ball.y_vel - fixed_ball.y_vel))
+
+    print(f"{trials} trials, {mismatches} hit different objects, largest difference {worst:.5f} "
+          f"(tolerance {tolerance})")
+    return worst <= tolerance and mismatches <= max_mismatches * trials
+
+
+# returns the largest difference between the stored bounce table and the curve computed with this machine's "math.cos"
+def table_deviation():
+    return max(abs(value - round(-math.cos((i - bounce_steps) / bounce_steps * math.pi) * 2 * scale))
+               for i, value in enumerate(bounce_table))
+
+
+# runs the conformance check and times both backends
+if __name__ == "__main__":
+    deviation = table_deviation()
+    print(f"bounce table differs from math.cos by at most {deviation} / {scale} pixels per frame")
+    passed = conformance_check() and deviation <= 1
+    platform_rect = pygame.Rect(175, 703, 50, 10)
+    for ball_class in (physics.Ball, FixedBall):
+        ball = ball_class(200, 400, 2.5, -5.4)
+        start = time.perf_counter()
+        for i in range(100000):
+            step_ball(ball, platform_rect, [])
+        print(f"{ball_class.__name__}: {100000 / (time.perf_counter() - start):,.0f} ball-frames per second")
+    if not passed:
+        raise SystemExit("the fixed point backend does not conform to the float backend")
@@ -0,0 +1,138 @@
+# import libraries
+import collections
+import time
+import pygame
+
+# frame pacing variables
+target_fps = 60
+busy_loop_headroom = 0.2    # fraction of the frame budget left under which "tick_busy_loop" is used instead of "tick"
+overload_window = 30        # frames looked at when deciding whether the game is overloaded
+overload_ratio = 0.5        # fraction of overrun frames in the window that counts as sustained overload
+recovery_headroom = 0.4     # fraction of the frame budget that has to be left on a frame for it to count as calm
+recovery_frames = 180       # calm frames in a row needed before a quality tier is restored
+late_input_margin = 2       # milliseconds kept spare between the predicted end of a late input frame and its deadline
+collect_interval = 0.001    # seconds between event collections while waiting
+vsync_wait = 1              # milliseconds a flip has to take to count as having waited for the vertical blank
+
+# optional work is given up in this order. every tier also keeps the reductions of the tiers before it
+quality_tiers = ("full", "coalesced effects", "reduced hud", "reduced background")
+coalesced_effects = 1
+reduced_hud = 2
+reduced_background = 3
+
+
+# paces the game loop and lowers the quality tier when frames keep running over their budget. the work time of a
+# frame is measured from the end of the previous "tick" to the start of the current one
+class FramePacer:
+    # FramePacer constructor
+    def __init__(self, clock: pygame.time.Clock, fps: int = target_fps):
+        self.clock = clock
+        self.fps = fps
+        self.budget = 1000 / fps
+        self.tier = 0
+        self.work_times = collections.deque(maxlen=overload_window)
+        self.calm_frames = 0
+        self.busy_loop = False
+        self.frames = 0
+        self.overruns = 0
+        self.tier_changes = 0
+        self.frame_start = time.perf_counter()
+        self.deadline = None
+        self.work_end = self.frame_start
+        self.flip_end = self.frame_start
+
+    # waits for the rest of the frame and returns the milliseconds since the previous tick. "tick" lets the thread
+    # sleep but can wake up a millisecond or two late, so "tick_busy_loop" is used when there is little time to spare.
+    # if "collect" is given it is called every "collect_interval" seconds while waiting, like in "wait_for_input"
+    def tick(self, collect=None):
+        work_time = (time.perf_counter() - self.frame_start) * 1000
+        self.work_times.append(work_time)
+        self.frames += 1
+        if work_time > self.budget:
+            self.overruns += 1
+
+        if collect is not None:
+            while (time.perf_counter() - self.frame_start) * 1000 < self.budget - 1:
+                collect()
+                time.sleep(collect_interval)
+
+        self.busy_loop = self.budget - work_time < busy_loop_headroom * self.budget
+        if self.busy_loop:
+            dt = self.clock.tick_busy_loop(self.fps)
+        else:
+            dt = self.clock.tick(self.fps)
+        self.frame_start = time.perf_counter()
+
+        self.adjust_quality(work_time)
+        return dt
+
+    # flips the display and remembers when the frame's work ended and when the flip returned. a flip that waits for
+    # the vertical blank returns right after it, which tells "wait_for_input" when the next one will be
+    def flip(self):
+        self.work_end = time.perf_counter()
+        pygame.display.flip()
+        self.flip_end = time.perf_counter()
+
+    # used instead of "tick" in late input mode and called right before the input is read. "tick" sleeps right after
+    # the flip, so input is read at the start of the frame and can be a whole frame old when it is shown. this sleeps
+    # until the slowest recent frame would only just finish before the next deadline instead, so input is read as
+    # late as possible. "collect" is called every "collect_interval" seconds while waiting so events are stamped close
+    # to when they happened. returns the milliseconds since the previous call
+    def wait_for_input(self, collect):
+        now = time.perf_counter()
+        work_time = (self.work_end - self.frame_start) * 1000
+        self.work_times.append(work_time)
+        self.frames += 1
+        if work_time > self.budget:
+            self.overruns += 1
+
+        # the deadlines follow the vertical blanks when the flip waits for them. otherwise they are spaced a frame
+        # apart, and a frame that ran past its deadline starts a new schedule instead of rushing to catch up
+        predicted = (max(self.work_times) + late_input_margin) / 1000
+        if (self.flip_end - self.work_end) * 1000 > vsync_wait:
+            self.deadline = self.flip_end + self.budget / 1000
+        elif self.deadline is None:
+            self.deadline = now + predicted
+        else:
+            self.deadline = max(self.deadline + self.budget / 1000, now + predicted)
+        wake_at = self.deadline - predicted
+
+        # sleeping in short steps wakes up on time without spinning for the whole wait
+        self.busy_loop = False
+        while now < wake_at:
+            collect()
+            time.sleep(min(collect_interval, wake_at - now))
+            now = time.perf_counter()
+        dt = self.clock.tick()
+        self.frame_start = time.perf_counter()
+
+        self.adjust_quality(work_time)
+        return dt
+
+    # steps the quality tier down under sustained overload and back up after a long enough calm stretch
+    def adjust_quality(self, work_time: float):
+        overrun_frames = sum(1 for time_taken in self.work_times if time_taken > self.budget)
+        if len(self.work_times) == overload_window and overrun_frames >= overload_ratio * overload_window:
+            if self.tier < len(quality_tiers) - 1:
+                self.tier += 1
+                self.tier_changes += 1
+            self.work_times.clear()
+            self.calm_frames = 0
+        elif self.budget - work_time > recovery_headroom * self.budget:
+            self.calm_frames += 1
+            if self.calm_frames >= recovery_frames and self.tier > 0:
+                self.tier -= 1
+                self.tier_changes += 1
+                self.calm_frames = 0
+        else:
+            self.calm_frames = 0
+
+    # returns True if the work that is dropped at "tier" should be skipped this frame
+    def reduced(self, tier: int):
+        return self.tier >= tier
+
+    def stats(self):
+        average = sum(self.work_times) / len(self.work_times) if self.work_times else 0
+        return {"tier": quality_tiers[self.tier], "fps": self.clock.get_fps(), "average work ms": average,
+                "max work ms": max(self.work_times, default=0), "busy loop": self.busy_loop,
+                "overrun frames": self.overruns, "frames": self.frames, "tier changes": self.tier_changes}
@@ -0,0 +1,65 @@
+# import libraries
+import os
+import queue
+import threading
+import time
+
+# hot reload variables
+watched_directories = ("Maps", "assets", "SoundFiles")
+poll_interval = 0.1     # seconds between scans of the watched directories
+debounce_time = 0.15    # seconds a file has to stay unchanged before it is reported
+
+
+# watches directories for changed files on a background thread by polling their modification times. editors often
+# write a file in several steps, so a change is only reported once the file has stopped changing for "debounce_time"
+# seconds. changes are handed to the game loop through a queue so the loop never waits on the file system
+class FileWatcher:
+    # FileWatcher constructor
+    def __init__(self, directories=watched_directories):
+        self.directories = directories
+        self.changes = queue.Queue()
+        self.running = True
+        self.mtimes = self.scan()
+        self.pending = {}
+        self.thread = threading.Thread(target=self.run_worker, daemon=True)
+        self.thread.start()
+
+    # returns the modification time of every file in the watched directories. paths use "/" like the rest of the game
+    def scan(self):
+        res = {}
+        for directory in self.directories:
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    res[f"{directory}/{entry.name}"] = entry.stat().st_mtime
+        return res
+
+    def run_worker(self):
+        while self.running:
+            time.sleep(poll_interval)
+            now = time.time()
+            mtimes = self.scan()
+
+            # a change restarts the file's debounce timer
+            for path, mtime in mtimes.items():
+                if self.mtimes.get(path) != mtime:
+                    self.pending[path] = now
+            self.mtimes = mtimes
+
+            for path, changed_at in list(self.pending.items()):
+                if now - changed_at >= debounce_time:
+                    del self.pending[path]
+                    if path in mtimes:
+                        self.changes.put((path, mtimes[path]))
+
+    # returns every change reported since the last call as (path, modification time) pairs without waiting
+    def poll(self):
+        res = []
+        while not self.changes.empty():
+            res.append(self.changes.get_nowait())
+        return res
+
+    def close(self):
+        self.running = False
+        self.thread.join()
@@ -0,0 +1,54 @@
+# import libraries
+import collections
+import math
+import time
+
+# input latency variables
+latency_samples = 10000     # latencies kept for the percentiles, the oldest are dropped first
+stats_interval = 30         # flips between updates of the stats shown on screen
+
+
+# measures the time from an input event being seen to the first flip that shows a frame built from it. events are
+# stamped when the game collects them from pygame, so the time an event waits in the queue before it is collected is
+# not included
+class LatencyTracker:
+    # LatencyTracker constructor
+    def __init__(self):
+        self.pending = []
+        self.latencies = collections.deque(maxlen=latency_samples)
+        self.events = 0
+        self.flips = 0
+        self.cached_stats = None
+        self.cached_at = 0
+
+    # remembers the times of the events the current frame was built from
+    def sampled(self, event_times: list):
+        self.pending.extend(event_times)
+
+    # call right after the flip. every pending event has now been shown
+    def flipped(self):
+        now = time.perf_counter()
+        for seen_at in self.pending:
+            self.latencies.append((now - seen_at) * 1000)
+        self.events += len(self.pending)
+        self.pending.clear()
+        self.flips += 1
+
+    # returns the stats of the recent events. sorting every latency takes milliseconds, which would land inside the
+    # latency being measured if it were done every frame, so the stats are only worked out again every
+    # "stats_interval" flips unless "refresh" is set
+    def stats(self, refresh: bool = False):
+        if refresh or self.cached_stats is None or self.flips - self.cached_at >= stats_interval:
+            ordered = sorted(self.latencies)
+            self.cached_stats = {"events": self.events, "p50 ms": percentile(ordered, 50),
+                                 "p99 ms": percentile(ordered, 99), "max ms": ordered[-1] if ordered else 0}
+            self.cached_at = self.flips
+        return self.cached_stats
+
+
+# returns the value that "percent" percent of the sorted values are at or under
+def percentile(ordered: list, percent: float):
+    if not ordered:
+        return 0
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
@@ -0,0 +1,60 @@
+# import libraries
+import os
+import random
+import zlib
+
+# layout variables
+level_width = 8
+max_level_height = 24
+num_colors = 10
+empty = -1
+
+
+# reads a level file from "Maps/" and returns its bricks as a grid of rows where every cell holds the brick's color
+# index or "empty". files with fewer than "max_level_height" rows are padded with empty rows
+def read_layout(file_path: str):
+    file = open(file_path, "r")
+    text = file.read()
+    file.close()
+    return parse_layout(text)
+
+
+# returns the grid of a layout in the text format of the files in "Maps/"
+def parse_layout(text: str):
+    chars = [char for char in text if char != "\n"]
+    grid = [[empty for i in range(level_width)] for j in range(max_level_height)]
+    for i, char in enumerate(chars[:level_width * max_level_height]):
+        if char != "e":
+            grid[i // level_width][i % level_width] = int(char)
+    return grid
+
+
+# returns a randomly generated grid. each cell is drawn from -3 to 9 and negative draws are left empty
+def random_layout(rng=random):
+    grid = [[empty for i in range(level_width)] for j in range(max_level_height)]
+
+    # determines how many layers of bricks there will be
+    num_layers = rng.randint(1, max_level_height)
+
+    # places bricks from left to right and top to bottom
+    for cell in range(num_layers * level_width):
+        color = rng.randint(-3, num_colors - 1)
+        if color >= 0:
+            grid[cell // level_width][cell % level_width] = color
+    return grid
+
+
+# returns the grid in the same text format as the files in "Maps/"
+def layout_text(grid):
+    return "".join("".join("e" if cell == empty else str(cell) for cell in row) + "\n" for row in grid)
+
+
+# returns a checksum of the names and contents of every level file in "directory". input logs store it so a replay can
+# tell whether it plays the same levels as the recorded run
+def maps_checksum(directory: str = "Maps"):
+    checksum = 0
+    for name in sorted(os.listdir(directory)):
+        level_file = open(os.path.join(directory, name), "rb")
+        checksum = zlib.crc32(name.encode() + b"\n" + level_file.read(), checksum)
+        level_file.close()
+    return checksum
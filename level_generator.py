@@ -0,0 +1,178 @@
+# import libraries
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import time
+import zlib
+import numpy
+import layouts
+import vector_env
+
+# level pool variables
+pool_path = "Level-Pool.json"
+pool_size = 480
+difficulty_buckets = 6
+endless_rounds = vector_env.num_levels     # rounds of an endless game, the game is won after the last one
+batch_size = 40             # layouts scored together by one worker
+min_bricks = 16
+
+# playout variables
+playouts = 8                # scripted games played on every layout
+playout_frames = 3600       # a playout ends after this many frames even if the ball has not been lost
+aim_error = 20              # standard deviation in pixels of how far from the ball the scripted paddle tries to be
+platform_zone = 30          # pixels above the platform in which a ball moving up counts as having hit the platform
+
+
+# returns a random layout made of horizontal color bands like the levels in "Maps/". most layouts mirror their left
+# half onto the right half, the bands are thinned out by "density" and some layouts get empty pockets carved into them
+def generate_layout(rng=random):
+    while True:
+        grid = [[layouts.empty for i in range(layouts.level_width)] for j in range(layouts.max_level_height)]
+        top = rng.randint(0, 3)
+        height = rng.randint(3, layouts.max_level_height - top)
+        band_height = rng.randint(1, 4)
+        first_color = rng.randrange(layouts.num_colors)
+        color_step = rng.choice((1, -1))
+        density = rng.uniform(0.5, 1)
+        symmetric = rng.random() < 0.75
+        half_width = layouts.level_width // 2
+
+        for row in range(top, top + height):
+            color = (first_color + (row - top) // band_height * color_step) % layouts.num_colors
+            for col in range(half_width if symmetric else layouts.level_width):
+                if rng.random() < density:
+                    grid[row][col] = color
+            if symmetric:
+                for col in range(half_width):
+                    grid[row][layouts.level_width - 1 - col] = grid[row][col]
+
+        # pockets are empty boxes inside the bricks. a ball that breaks into one bounces around in it for a while
+        for i in range(rng.randint(0, 3) if height >= 4 else 0):
+            pocket_height = rng.randint(1, min(3, height - 2))
+            pocket_width = rng.randint(1, 3)
+            row = rng.randint(top + 1, top + height - 1 - pocket_height)
+            col = rng.randint(1, layouts.level_width - 1 - pocket_width)
+            for r in range(row, row + pocket_height):
+                for c in range(col, col + pocket_width):
+                    grid[r][c] = layouts.empty
+                    if symmetric:
+                        grid[r][layouts.level_width - 1 - c] = layouts.empty
+
+        if sum(cell != layouts.empty for row in grid for cell in row) >= min_bricks:
+            return grid
+
+
+# returns the difficulty of each grid as the average fraction of its bricks still standing when a playout ends. every
+# grid is played "num_playouts" times in a fixed point "VectorBreakout" by a scripted paddle that follows the lowest
+# falling ball but misses it by a random amount that changes on every platform bounce
+def score_layouts(grids: list, seed: int = 0, num_playouts: int = playouts, frames: int = playout_frames):
+    count = len(grids) * num_playouts
+    env = vector_env.VectorBreakout(count, seed=seed, fixed=True)
+    rng = numpy.random.default_rng(seed)
+    unit = env.unit
+    env.start_round(numpy.ones(count, bool), numpy.repeat(numpy.array(grids, numpy.int8), num_playouts, axis=0))
+
+    totals = env.bricks_left.copy()
+    broken = numpy.zeros(count, numpy.int32)
+    finished = numpy.zeros(count, bool)
+    aim = rng.normal(0, aim_error * unit, count)
+    for frame in range(frames):
+        falling = env.ball_active & (env.ball_y_vel > 0)
+        lowest = numpy.argmax(numpy.where(falling, env.ball_y, -1), axis=1)
+        distance = env.ball_x[env.world_index, lowest] + aim - env.platform_x
+        actions = numpy.where(numpy.abs(distance) < vector_env.platform_speed * unit, 0, numpy.sign(distance))
+
+        y_vel = env.ball_y_vel.copy()
+        _, rewards, dones = env.step(actions)
+        broken += rewards * ~finished
+        finished |= dones | (broken >= totals)
+        if finished.all():
+            break
+
+        bounced = ((y_vel > 0) & (env.ball_y_vel < 0)
+                   & (env.ball_y > (vector_env.platform_y - platform_zone) * unit)).any(axis=1)
+        aim[bounced] = rng.normal(0, aim_error * unit, numpy.count_nonzero(bounced))
+
+    left = 1 - broken / totals
+    return left.reshape(len(grids), num_playouts).mean(axis=1)
+
+
+# generates and scores "count" layouts. runs in a worker process, so the layouts are generated there from "seed"
+# instead of being sent over
+def score_batch(args: tuple):
+    seed, count = args
+    grids = [generate_layout(random.Random(seed * batch_size + i)) for i in range(count)]
+    difficulties = score_layouts(grids, seed)
+    return [(float(difficulty), layouts.layout_text(grid)) for difficulty, grid in zip(difficulties, grids)]
+
+
+# generates "size" layouts, scores them in parallel across "processes" worker processes (one per cpu by default) and
+# returns them sorted by difficulty and split into "difficulty_buckets" buckets of the same size. the playouts use
+# fixed point physics, so the same seed builds the same pool on every machine
+def build_pool(size: int = pool_size, processes: int = None, seed: int = 0):
+    batches = [(seed * 10000 + i, min(batch_size, size - i * batch_size)) for i in range(math.ceil(size / batch_size))]
+    with multiprocessing.Pool(processes) as workers:
+        results = workers.map(score_batch, batches)
+
+    scored = sorted((pair for batch in results for pair in batch), key=lambda pair: pair[0])
+    return [[{"difficulty": round(difficulty, 4), "layout": text}
+             for difficulty, text in scored[i * len(scored) // difficulty_buckets:
+                                             (i + 1) * len(scored) // difficulty_buckets]]
+            for i in range(difficulty_buckets)]
+
+
+# writes the pool to a temporary file first so the game never reads a half written pool
+def write_pool(buckets: list, path: str = pool_path, seed: int = 0):
+    pool_file = open(path + ".tmp", "w")
+    json.dump({"seed": seed, "playouts": playouts, "frames": playout_frames, "buckets": buckets}, pool_file)
+    pool_file.close()
+    os.replace(path + ".tmp", path)
+
+
+# returns the grids of the pool at "path" grouped by bucket from easiest to hardest, or None if there is no pool. the
+# grids are parsed here so drawing one during the game costs nothing
+def read_pool(path: str = pool_path):
+    if not os.path.exists(path):
+        return None
+    pool_file = open(path, "r")
+    buckets = json.load(pool_file)["buckets"]
+    pool_file.close()
+    return [[layouts.parse_layout(entry["layout"]) for entry in bucket] for bucket in buckets if bucket]
+
+
+# returns a checksum of the layouts in the pool and their buckets, or None if there is no pool. input logs store it
+# so a replay can tell whether it draws from the same pool as the recorded run
+def pool_checksum(pool: list):
+    if pool is None:
+        return None
+    text = "\n".join("".join(layouts.layout_text(grid) for grid in bucket) for bucket in pool)
+    return zlib.crc32(text.encode())
+
+
+# returns a grid from the bucket that matches the endless round. the "endless_rounds" rounds are spread evenly over the
+# buckets, so the first round draws from the easiest bucket and the last round from the hardest
+def draw_layout(pool: list, round_num: int, rng=random):
+    bucket = min((round_num - 1) * len(pool) // endless_rounds, len(pool) - 1)
+    return rng.choice(pool[bucket])
+
+
+# builds the level pool and writes it to "pool_path"
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="builds the pool of generated endless levels")
+    parser.add_argument("--size", type=int, default=pool_size, help="number of layouts in the pool")
+    parser.add_argument("--processes", type=int, help="worker processes to score layouts with (default: one per cpu)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=pool_path)
+    options = parser.parse_args()
+
+    start = time.perf_counter()
+    pool = build_pool(options.size, options.processes, options.seed)
+    write_pool(pool, options.out, options.seed)
+    print(f"scored {options.size} layouts in {time.perf_counter() - start:.1f}s")
+    for i, bucket in enumerate(pool):
+        if bucket:
+            print(f"bucket {i}: {len(bucket)} layouts, difficulty {bucket[0]['difficulty']:.3f} to "
+                  f"{bucket[-1]['difficulty']:.3f}")
@@ -1,29 +1,120 @@
 # import libraries
-import math
+import argparse
+import os
 import random
+import shutil
+import sys
+import tempfile
+import time
+import layouts
+import memory_telemetry
+
+# command line options
+#########################################################
+parser = argparse.ArgumentParser(description="Atari Breakout")
+parser.add_argument("--record", metavar="LOG", help="write every frame of input to an input log")
+parser.add_argument("--export", nargs=2, metavar=("LOG", "OUT"),
+                    help="replay an input log off-screen and write the raw frames to OUT (\"-\" for stdout)")
+parser.add_argument("--frame-skip", type=int, default=1, help="only export every Nth frame")
+parser.add_argument("--crop", type=int, nargs=4, metavar=("X", "Y", "W", "H"), help="only export this region")
+parser.add_argument("--pacing-stats", action="store_true",
+                    help="show the frame pacing quality tier and timings on screen and print them on exit")
+parser.add_argument("--watch", action="store_true",
+                    help="reload changed files in Maps/, assets/ and SoundFiles/ while the game is running")
+parser.add_argument("--memory-report", metavar="PATH",
+                    help="trace memory, snapshot it on every game state change and write a report to PATH on exit")
+parser.add_argument("--fixed-point", action="store_true",
+                    help="move balls with integer fixed point physics so runs play out the same on every machine. "
+                         "exports use the physics the input log was recorded with")
+parser.add_argument("--late-input", action="store_true",
+                    help="sleep before reading input instead of after the flip so input is shown sooner")
+parser.add_argument("--latency-stats", action="store_true",
+                    help="show the input to display latency on screen and print it on exit")
+options = parser.parse_args()
+
+# files reloaded while the game runs are not part of the input log, so a run that used them could not be replayed
+if options.watch and (options.record is not None or options.export is not None):
+    parser.error("--watch can not be combined with --record or --export")
+
+# exporting renders without a window or sound, so the dummy drivers are used. the pygame banner is hidden so it does
+# not end up in frames written to stdout
+if options.export is not None:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+#########################################################
+
 import pygame
+import fixed_point
+import frame_pacing
+import hot_reload
+import input_latency
+import level_generator
+import particles
+import physics
+import replay
+import run_history
 
 pygame.init()
 
 # pygame variables
-screen_dimensions = (400, 750)
+screen_dimensions = physics.screen_dimensions
 screen_center = (screen_dimensions[0] / 2, screen_dimensions[1] / 2)
 screen_center_x = screen_center[0]
 screen_center_y = screen_center[1]
-screen = pygame.display.set_mode(screen_dimensions)
 clock = pygame.time.Clock()
+pacer = frame_pacing.FramePacer(clock)
+latency = input_latency.LatencyTracker()
+
+# the pool of generated endless levels sorted into difficulty buckets, built with "python level_generator.py"
+level_pool = level_generator.read_pool()
+
+# when exporting, the game is drawn on an off-screen surface and the display only exists so images can be converted.
+# levels are read from and saved to a throwaway copy of "Maps/" so a replayed level creator save does not overwrite
+# the real custom levels. the settings that change how the game plays out are stored in the input log and exports use
+# the ones the log was recorded with
+if options.export is None:
+    screen = pygame.display.set_mode(screen_dimensions)
+    input_source = replay.LiveInput(random.randrange(2 ** 32), options.record,
+                                    {"physics": "fixed point" if options.fixed_point else "float",
+                                     "level pool": level_generator.pool_checksum(level_pool),
+                                     "maps": layouts.maps_checksum()})
+    exporter = None
+    maps_directory = "Maps"
+else:
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface(screen_dimensions)
+    input_source = replay.ReplayInput(options.export[0])
+    if input_source.settings.get("level pool") != level_generator.pool_checksum(level_pool):
+        raise SystemExit(f"{options.export[0]} was recorded with a different {level_generator.pool_path}, so its "
+                         f"endless rounds would not play out the same")
+    if input_source.settings.get("maps") != layouts.maps_checksum():
+        raise SystemExit(f"the levels in Maps/ have changed since {options.export[0]} was recorded, so its rounds "
+                         f"would not play out the same")
+    exporter = replay.FrameExporter(options.export[1], options.frame_skip, options.crop)
+    maps_directory = shutil.copytree("Maps", os.path.join(tempfile.mkdtemp(), "Maps"))
+random.seed(input_source.seed)
+
+# images and fonts that have already been loaded, so they are only created once
+loaded_images = {}
+loaded_fonts = {}
 
 # default object values
-bricks = []
 block_width = screen_dimensions[0] / 8
 block_height = block_width / 3
 powerup_chance = 4      # out of ten
-max_level_height = 24
-ball_radius = 8
+max_level_height = layouts.max_level_height
+ball_radius = physics.ball_radius
 powerup_choices = ["extra ball", "long platform"]
 default_platform_dimensions = [50, 10]
-platform_speed = 5
+platform_speed = physics.platform_speed
+if input_source.settings.get("physics", "float") == "fixed point":
+    Ball = fixed_point.FixedBall
+else:
+    Ball = physics.Ball
 colors = ("red", "orange", "yellow", "green", "blue", "cyan", "purple", "pink", "grey", "white")
+number_keys = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8,
+               pygame.K_9, pygame.K_0)
 info = ("In this game, you control a paddle which can move\n"
         "horizontally across the screen. The player must knock down\n"
         "as many bricks as possible by using the walls and/or the\n"
@@ -40,215 +131,21 @@ info = ("In this game, you control a paddle which can move\n"
         "will show the leaderboard for endless mode.")
 
 
-class Ball:
-    # Ball constructor
-    def __init__(self, x: int | float, y: int | float, x_vel: int | float, y_vel: int | float, color: tuple = None):
-        self.x = x
-        self.y = y
-        self.x_vel = x_vel
-        self.y_vel = y_vel
-        self.rect = pygame.Rect([x - ball_radius, y - ball_radius], [2 * ball_radius, 2 * ball_radius])
-        if color is None:
-            self.color = (255, 0, 0)
-        else:
-            self.color = color
-
-    # handles the collision of the ball against a rectangle on the screen and decides how to bounce the ball.
-    def handle_rect_bounce(self, rect, object_hit="brick"):
-
-        # Sets velocity based on which side of the brick the ball has hit
-        if self.x < rect.centerx:  # ball left of brick
-
-            if self.y < rect.centery:  # ball to the top left of brick
-
-                new_vel = get_new_vel(self, [-1, -1], rect, object_hit)
-
-                self.x_vel, self.y_vel = new_vel[0], new_vel[1]
-            else:  # ball to the bottom left of brick
-
-                new_vel = get_new_vel(self, [-1, 1], rect, object_hit)
-
-                self.x_vel, self.y_vel = new_vel[0], new_vel[1]
-        else:  # ball right of brick
+class Button:
+    # Button constructor. the image is scaled to "size" and centered on "center"
+    def __init__(self, path: str, center: [int, int], size: [int, int] = (200, 50)):
+        self.path = path
+        self.size = size
+        self.image = load_image(path, size)
+        self.rect = self.image.get_rect()
+        self.rect.center = center
 
-            if self.y < rect.centery:  # ball to the top right of brick
+    # returns True if the button was clicked on this frame
+    def clicked(self, mouse_pos, clicked: bool):
+        return clicked and self.rect.collidepoint(mouse_pos)
 
-                new_vel = get_new_vel(self, [1, -1], rect, object_hit)
-
-                self.x_vel, self.y_vel = new_vel[0], new_vel[1]
-            else:  # ball to the bottom right of brick
-
-                new_vel = get_new_vel(self, [1, 1], rect, object_hit)
-
-                self.x_vel, self.y_vel = new_vel[0], new_vel[1]
-
-    def set_pos(self, x, y):
-        self.x = x
-        self.y = y
-
-        if self.x - ball_radius < 0:
-            self.x = ball_radius
-            self.x_vel *= -1
-        if self.x + ball_radius > screen_dimensions[0]:
-            self.x = screen_dimensions[0] - ball_radius
-            self.x_vel *= -1
-        if self.y - ball_radius < 0:
-            self.y = ball_radius
-            self.y_vel *= -1
-        if self.y + ball_radius > screen_dimensions[1]:
-            self.y = screen_dimensions[1] - ball_radius
-            self.y_vel *= -1
-
-        self.rect.center = [self.x, self.y]
-
-    # updates the ball's position according to it's speed
-    def update_pos(self):
-        self.x += self.x_vel
-        self.y += self.y_vel
-
-        # puts the ball back on the screen and bounces it if the ball has hit a wall
-        if self.x - ball_radius < 0:
-            self.x = ball_radius
-            self.x_vel *= -1
-        if self.x + ball_radius > screen_dimensions[0]:
-            self.x = screen_dimensions[0] - ball_radius
-            self.x_vel *= -1
-        if self.y - ball_radius < 0:
-            self.y = ball_radius
-            self.y_vel *= -1
-
-        self.rect.center = [self.x, self.y]
-
-    # draws the ball on the screen
-    def draw(self, surface: pygame.Surface):
-        pygame.draw.circle(surface, self.color, [self.x, self.y], ball_radius)
-
-
-class Platform:
-    # Platform constructor
-    def __init__(self, x, y, width, height, speed, color=(255, 255, 255)):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.color = color
-        self.rect = pygame.Rect(x, y, width, height)
-
-    # resets the conditions of the platform to their defaults
-    def reset(self):
-        self.set_width(50)
-        self.x = 175
-        self.rect.centerx = screen_center_x
-
-    def change_width(self, inc):
-        self.rect.width += inc
-        self.width += inc
-
-    def set_width(self, w):
-        self.width = w
-        self.rect.width = w
-
-    # takes the player's inputs and moves the platform accordingly
-    def player_move(self, inputs):
-        if inputs[pygame.K_a] or inputs[pygame.K_LEFT]:
-            self.x -= platform_speed
-            self.rect = self.rect.move(-platform_speed, 0)
-        if inputs[pygame.K_d] or inputs[pygame.K_RIGHT]:
-            self.x += platform_speed
-            self.rect = self.rect.move(platform_speed, 0)
-
-        if self.rect.right > screen_dimensions[0]:
-            self.rect.right = screen_dimensions[0]
-        if self.rect.left < 0:
-            self.rect.left = 0
-
-    # draws the platform on the screen
     def draw(self, surface: pygame.Surface):
-        pygame.draw.rect(surface, self.color, self.rect)
-
-
-# returns -1 if the parameter number is negative, 0 if it is 0, and 1 if it is positive
-def normalize(num):
-    if num > 0:
-        return 1
-    elif num < 0:
-        return -1
-    else:
-        return 0
-
-
-# takes ball and brick objects and calculates and returns the appropriate velocity for the ball.
-# meant to make the ball bounce off of platforms and bricks
-def get_new_vel(ball, norm_cords, rect, object_hit):
-    if object_hit == "platform":
-        ratio = (rect.left - ball.x) / rect.width * math.pi
-        ball.x_vel = -math.cos(ratio) * 2
-    norm_vel_cords = [normalize(ball.x_vel), normalize(ball.y_vel)]
-    dist = 0
-    for i in range(len(norm_vel_cords)):
-        if norm_vel_cords[i] != norm_cords[i]:
-            dist += 1
-    dist_arr = [0 if norm_vel_cords[i] == norm_cords[i] else 1 for i in range(len(norm_cords))]
-    match dist:
-        case 0:
-            if norm_cords[0] == -1:
-                ball.set_pos(rect.left - ball_radius, ball.y)
-            else:
-                ball.set_pos(rect.right + ball_radius, ball.y)
-            return [norm_vel_cords[0] * abs(ball.x_vel), ball.y_vel]
-        case 1:
-            if dist_arr[0] == 1:
-                if norm_cords[0] == -1:
-                    ball.set_pos(rect.left - ball_radius, ball.y)
-                else:
-                    ball.set_pos(rect.right + ball_radius, ball.y)
-                return [-norm_vel_cords[0] * abs(ball.x_vel), ball.y_vel]
-            else:
-                if norm_cords[1] == -1:
-                    ball.set_pos(ball.x, rect.top - ball_radius)
-                else:
-                    ball.set_pos(ball.x, rect.bottom + ball_radius)
-                return [ball.x_vel, -norm_vel_cords[1] * abs(ball.y_vel)]
-        case 2:
-            if abs(ball.x_vel) > .1:
-                m = ball.y_vel / ball.x_vel
-            else:
-                if norm_vel_cords[1] == 1:
-                    ball.set_pos(ball.x, rect.top - ball_radius)
-                    return [ball.x_vel, -abs(ball.y_vel)]
-                else:
-                    ball.set_pos(ball.x, rect.bottom + ball_radius)
-                    return [ball.x_vel, abs(ball.y_vel)]
-
-            match norm_vel_cords:
-                case [1, 1]:
-                    if m * (rect.left - ball.x) + ball.y > rect.top:
-                        ball.set_pos(rect.left - ball_radius, ball.y)
-                        return [-abs(ball.x_vel), ball.y_vel]
-                    else:
-                        ball.set_pos(ball.x, rect.top - ball_radius)
-                        return [ball.x_vel, -abs(ball.y_vel)]
-                case [-1, 1]:
-                    if m * (rect.right - ball.x) + ball.y < rect.top:
-                        ball.set_pos(ball.x, rect.top - ball_radius)
-                        return [ball.x_vel, -abs(ball.y_vel)]
-                    else:
-                        ball.set_pos(rect.right + ball_radius, ball.y)
-                        return [abs(ball.x_vel), ball.y_vel]
-                case [1, -1]:
-                    if m * (rect.left - ball.x) + ball.y > rect.bottom:
-                        ball.set_pos(ball.x, rect.bottom + ball_radius)
-                        return [ball.x_vel, abs(ball.y_vel)]
-                    else:
-                        ball.set_pos(rect.left - ball_radius, ball.y)
-                        return [-abs(ball.x_vel), ball.y_vel]
-                case [-1, -1]:
-                    if m * (rect.right - ball.x) + ball.y > rect.bottom:
-                        ball.set_pos(ball.x, rect.bottom + ball_radius)
-                        return [ball.x_vel, abs(ball.y_vel)]
-                    else:
-                        ball.set_pos(rect.right + ball_radius, ball.y)
-                        return [abs(ball.x_vel), ball.y_vel]
+        surface.blit(self.image, self.rect.topleft)
 
 
 # Takes the coordinates of the platform and decides whether to spawn a powerup using the random module. "long platform"
@@ -261,134 +158,114 @@ def spawn_powerup(x_pos, y_pos, speed):
         choice = random.choice(powerup_choices)
         if choice == "extra ball":
             # adds a ball to the game at the platform's position
-            balls.append(Ball(x_pos, y_pos - platform.height / 2 - ball_radius, 0, -speed))
+            session.balls.append(Ball(x_pos, y_pos - session.platform.height / 2 - ball_radius, 0, -speed))
+            session.recorder.ball_spawned()
         if choice == "long platform":
 
             # increases the platform width
-            platform.rect.width += 5
-            platform.width += 5
+            session.platform.rect.width += 5
+            session.platform.width += 5
 
             # if the platform width has increased beyond half of the screen's width, the platform's width is set to half
             # the screen width
-            if platform.width > screen_dimensions[0] / 2:
-                platform.set_width(screen_dimensions[0] / 2)
-
-
-# adds a score to the "Endless-High-Scores" file and organizes the file with the top ten scores from highest to lowest
-def add_high_score(added_score: int):
-    scores_file = open("Endless-High-Scores", "r")
-
-    # puts the scores in the "Endless-High-Scores" in the "scores" array
-    scores = []
-    for line in scores_file:
-        string = ""
-        for char in line:
-            if char in "1234567890":
-                string += char
-        if string != "":
-            scores.append(int(string))
-
-    # adds the "added_score" to the "scores" array
-    if added_score >= 0:
-        scores.append(added_score)
-
-    # organizes the array with the scores going from highest on the left to lowest on the right
-    scores.sort()
-    scores.reverse()
-
-    # isolates the top ten scores from the "scores" array
-    if len(scores) <= 10:
-        top_ten_scores = scores
-    else:
-        top_ten_scores = scores[:10]
+            if session.platform.width > screen_dimensions[0] / 2:
+                session.platform.set_width(screen_dimensions[0] / 2)
 
-    scores_file.close()
 
-    # re-writes the reorganized high scores in the "Endless-High-Scores" file
-    scores_file = open("Endless-High-Scores", "w")
-    for number in top_ten_scores:
-        scores_file.write(str(number) + "\n")
-    scores_file.close()
-
-    return scores
+# returns an array of the rect objects and colors of the bricks in the grid returned by the "layouts" module
+def get_grid_bricks(grid):
+    res = []
+    for row in range(max_level_height):
+        for col in range(8):
+            if grid[row][col] != layouts.empty:
+                res.append((pygame.Rect([col * block_width + 1, row * block_height + 1],
+                                        [block_width - 2, block_height - 2]), colors[grid[row][col]]))
+    return res
 
 
 # spawns the bricks associated with each level normal or custom and adds the rect objects and colors to the "bricks"
 # array
 def level_spawn_bricks(round_num, is_custom):
-    # determines whether the level is custom or normal and gets the text from the file
+    # determines whether the level is custom or normal and gets the bricks from the file
     if is_custom:
         inter = "Custom"
     else:
         inter = ""
-    string = get_file_text("Maps/" + inter + "Level-" + str(round_num))
+    return get_grid_bricks(layouts.read_layout(maps_directory + "/" + inter + "Level-" + str(round_num)))
 
-    # turns the text received from the level file into an array of the corresponding descriptive characters
-    brick_arr = tuple(char for char in string if char != "\n")
 
-    # fills the "res" array with each existing brick and its associated color
-    res = []
-    row = 0
-    for i, index in enumerate(brick_arr):
-        if index != "e":
-            index = int(index)
-            color = colors[index]
-            res.append((pygame.Rect([i % 8 * block_width + 1, row * block_height + 1],
-                                    [block_width - 2, block_height - 2]), color))
-        if (i + 1) % 8 == 0:
-            row += 1
+# returns an array of bricks for an endless round. the layout is drawn from the generated level pool when there is one
+# and is generated randomly otherwise
+def random_spawn_bricks(round_num):
+    if level_pool is None:
+        return get_grid_bricks(layouts.random_layout())
+    return get_grid_bricks(level_generator.draw_layout(level_pool, round_num))
 
-    return res
 
+# returns the bricks in the same text format as the files in "Maps/" so the layout can be stored with the run history
+def get_layout_text(brick_list):
+    grid = [[layouts.empty for i in range(8)] for j in range(max_level_height)]
+    for brick in brick_list:
+        grid[int(brick[0].y // block_height)][int(brick[0].x // block_width)] = colors.index(brick[1])
+    return layouts.layout_text(grid)
 
-# returns an array of randomly generated bricks
-def random_spawn_bricks():
-    res = []
 
-    # determines how many layers of bricks there will be
-    num_layers = random.randint(1, max_level_height)
+# returns the font of the given size, loading it the first time it is used
+def get_font(font_size: int):
+    if font_size not in loaded_fonts:
+        loaded_fonts[font_size] = pygame.font.Font(None, font_size)
+    return loaded_fonts[font_size]
 
-    # places bricks from left to right and top to bottom
-    for layer in range(num_layers * 8):
-        color = random.randint(-3, 9)
-
-        # if the "color" index is negative, no brick is added at the current location
-        if color >= 0:
-            res.append((pygame.Rect([layer % 8 * block_width + 1, layer // 8 * block_height + 1],
-                                    [block_width - 2, block_height - 2]), colors[color]))
 
+# renders the text of a message once and returns each line's surface and position so the message can be drawn every
+# frame with "surface.blits". for every "\n" in the "msg", the rest of the text is placed on the next line.
+def prerender_message(msg: str, position: [int, int], font_size: int):
+    font = get_font(font_size)
+    res = []
+    for i, split in enumerate(msg.split("\n")):
+        title = font.render(split, True, (255, 255, 255))
+        title_rect = title.get_rect()
+        title_rect.center = (position[0], position[1] + i * font_size)
+        res.append((title, title_rect.topleft))
     return res
 
 
-# displays a string on the screen. for every "\n" in the "msg", the display will display teh rest of the text on the
-# next line.
+# displays a string on the screen. for text that does not change between frames use "prerender_message" instead
 def render_message(surface: pygame.surface, msg: str, position: [int, int], font_size: int):
-    # fills the "splits" array with each chunk of text in between "\n" characters
-    splits = []
-    temp = 0
-    for i, char in enumerate(msg):
-        if char == "\n":
-            splits.append(msg[temp:i])
-            temp = i + 1
-    splits.append(msg[temp:])
-
-    # renders each chunk of text on its own line
-    for i, split in enumerate(splits):
-        font = pygame.font.Font(None, font_size)
-        title = font.render(split, True, (255, 255, 255))
-        title_rect = title.get_rect()
-        title_rect.center = (position[0], position[1] + i * font_size)
-        surface.blit(title, title_rect.topleft)
+    surface.blits(prerender_message(msg, position, font_size))
+
+
+# returns the image at "path" scaled to "scale". each image is only loaded and scaled the first time it is used at
+# that scale
+def load_image(path: str, scale: [int, int]):
+    if (path, tuple(scale)) not in loaded_images:
+        img = pygame.image.load(path).convert()
+        loaded_images[(path, tuple(scale))] = pygame.transform.scale(img, scale)
+    return loaded_images[(path, tuple(scale))]
 
 
 # renders an image from the "path" parameter on the screen and scales it according to the scale "parameter"
 def render_image(surface: pygame.surface, path: str, position: [int, int], scale: [int, int]):
-    img = pygame.image.load(path).convert()
-    img = pygame.transform.scale(img, scale)
+    img = load_image(path, scale)
     surface.blit(img, (position[0] - scale[0] / 2, position[1] - scale[1] / 2))
     return img
 
 
+# displays the score in the bottom left corner. the text is kept between frames and only re-rendered when the score
+# changes, but no sooner than "refresh_frames" frames after the last time it was rendered
+def render_score(surface: pygame.surface, value: int, refresh_frames: int):
+    score_hud["age"] += 1
+    # the first score is always rendered, since there is no older surface to keep showing
+    stale = score_hud["value"] != value and score_hud["age"] >= refresh_frames
+    if score_hud["surface"] is None or stale:
+        score_hud["value"] = value
+        score_hud["surface"] = get_font(32).render(f"Score: {value}", True, (255, 255, 255))
+        score_hud["age"] = 0
+    score_rect = score_hud["surface"].get_rect()
+    score_rect.center = (100, screen_dimensions[1] - 15)
+    surface.blit(score_hud["surface"], score_rect.topleft)
+
+
 # returns all the text in the file specified in a single string
 def get_file_text(file_path: str):
     file = open(file_path, "r")
@@ -401,7 +278,7 @@ def get_file_text(file_path: str):
 
 # returns a 2D array of the brick info associated with each brick space for the file given
 def get_edit_brick_placeholders(custom_file_num: int):
-    file_text = get_file_text(f"Maps/CustomLevel-{custom_file_num}")
+    file_text = get_file_text(f"{maps_directory}/CustomLevel-{custom_file_num}")
     chars = [char for char in file_text if char != "\n"]
     res = [[chars[j * 8 + i] for j in range(max_level_height)] for i in range(8)]
     return res
@@ -418,51 +295,653 @@ def get_render_bricks(placeholders):
     return res
 
 
+# loops the music at "path". nothing happens if that music is already playing
 def loop_music(path: str):
+    if now_playing["path"] == path:
+        return
     pygame.mixer.music.unload()
     pygame.mixer.music.load(path)
     pygame.mixer.music.play(-1)
+    now_playing["path"] = path
+
+
+def stop_music():
+    pygame.mixer.music.unload()
+    now_playing["path"] = None
+
+
+# the objects, score and round information of the game that is currently being played
+class Session:
+    # Session constructor
+    def __init__(self):
+        self.balls = [Ball(0, 0, 0, 0), ]
+        self.platform = physics.Platform(175, screen_dimensions[1] * 15 / 16,
+                                         default_platform_dimensions[0], default_platform_dimensions[1],
+                                         platform_speed)
+        self.bricks = []
+        self.current_round = 1
+        self.score = 0
+        self.total_score = 0
+        self.max_round_score = self.current_round * 8
+        self.endless = False
+        self.custom = False
+        self.high_score = False
+        self.recorder = run_history.RunRecorder("endless")
+
+    # starts a new run of "mode" ("endless", "normal levels" or "custom levels") from the first round
+    def start_run(self, mode: str):
+        self.score = 0
+        self.total_score = 0
+        self.current_round = 1
+        self.endless = mode == "endless"
+        self.custom = mode == "custom levels"
+        self.high_score = False
+        self.recorder = run_history.RunRecorder(mode)
+        self.spawn_bricks()
+
+    # spawns the bricks of the current round and sets the score needed to finish it
+    def spawn_bricks(self):
+        self.load_bricks()
+        self.recorder.start_round(self.current_round, get_layout_text(self.bricks))
+
+    def load_bricks(self):
+        if self.endless:
+            self.bricks = random_spawn_bricks(self.current_round)
+            self.max_round_score = len(self.bricks)
+        elif not self.custom:
+            self.bricks = level_spawn_bricks(self.current_round, self.custom)
+            self.max_round_score = self.current_round * 8
+        else:
+            self.bricks = level_spawn_bricks(self.current_round, self.custom)
+            self.max_round_score = len(self.bricks)
+
+    # returns the "Maps/" file of the current round, or None in endless mode
+    def level_path(self):
+        if self.endless:
+            return None
+        return f"{maps_directory}/{'Custom' if self.custom else ''}Level-{self.current_round}"
+
+    # puts the platform back in the middle and keeps a single ball for the next launch
+    def reset_objects(self):
+        self.platform.reset()
+        self.balls = [self.balls[0]] if self.balls else [Ball(0, 0, 0, 0), ]
+        debris.clear()
+
+    # draws the bricks, balls and platform of the round
+    def draw(self, surface: pygame.Surface):
+        for brick in self.bricks:
+            pygame.draw.rect(surface, brick[1], brick[0])
+        for ball in self.balls:
+            ball.draw(surface)
+        debris.draw(surface)
+        self.platform.draw(surface)
+
+
+# a game state. "enter" builds everything the state needs to draw its frames, like button layouts and pre-rendered
+# text, and "exit" releases it again, so "update" and "draw" do no setup work on a steady frame. "update" returns the
+# name of the next game state or None to stay in this one
+class Scene:
+    # Scene constructor
+    def __init__(self):
+        self.buttons = {}
+        self.texts = []
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        self.buttons = {}
+        self.texts = []
+
+    def update(self, frame_input: replay.FrameInput, clicked: bool):
+        return None
+
+    # draws the scene's pre-rendered text and buttons
+    def draw(self, surface: pygame.Surface):
+        for text in self.texts:
+            surface.blits(text)
+        for button in self.buttons.values():
+            button.draw(surface)
+
+    # swaps in the images that have been reloaded since the buttons were made
+    def reload_images(self):
+        for button in self.buttons.values():
+            button.image = load_image(button.path, button.size)
+
+    # returns the name of the first button that was clicked on this frame
+    def clicked_button(self, frame_input: replay.FrameInput, clicked: bool):
+        for name, button in self.buttons.items():
+            if button.clicked(frame_input.mouse_pos, clicked):
+                return name
+        return None
+
+
+class TitleScene(Scene):
+    def enter(self):
+        loop_music("SoundFiles/menu-background.wav")
+        session.reset_objects()
+        session.balls = [Ball(0, 0, 0, 0), ]
+
+        # "title-screen.png" is centered on this position
+        background_center = (screen_center_x + 70, screen_center_y + 110)
+        self.background = load_image("assets/title-screen.png", screen_dimensions)
+        self.background_pos = (background_center[0] - screen_dimensions[0] / 2,
+                               background_center[1] - screen_dimensions[1] / 2)
+        self.buttons = {
+            "play levels": Button("assets/Play-Levels.png", (screen_center_x, screen_center_y - 120)),
+            "play endless": Button("assets/Play-Endless.png", (screen_center_x, screen_center_y - 50)),
+            "level creator": Button("assets/Level-Creator.png", (screen_center_x, screen_center_y + 20)),
+            "high scores": Button("assets/High-Scores.png", (screen_center_x, screen_center_y + 90)),
+            "info": Button("assets/Info.png", (screen_center_x, screen_center_y + 160)),
+            "quit": Button("assets/Quit.png", (screen_center_x, screen_center_y + 230)),
+        }
+        self.texts = [prerender_message("Atari Breakout", [screen_center_x, 100], 64)]
+
+    def exit(self):
+        super().exit()
+        self.background = None
+
+    def reload_images(self):
+        super().reload_images()
+        self.background = load_image("assets/title-screen.png", screen_dimensions)
+
+    # switches the game state based on which (if any) button the user presses
+    def update(self, frame_input, clicked):
+        match self.clicked_button(frame_input, clicked):
+            case "play levels":
+                return "level select"
+            case "play endless":
+                session.start_run("endless")
+                return "pre round"
+            case "high scores":
+                return "leaderboard"
+            case "info":
+                return "info"
+            case "quit":
+                return "off"
+            case "level creator":
+                return "level creator"
+        return None
+
+    def draw(self, surface):
+        if not pacer.reduced(frame_pacing.reduced_background):
+            surface.blit(self.background, self.background_pos)
+        super().draw(surface)
+
+
+class LevelSelectScene(Scene):
+    def enter(self):
+        self.buttons = {
+            "custom levels": Button("assets/Custom-Levels.png", (screen_center_x, screen_center_y + 50)),
+            "normal levels": Button("assets/Normal-Levels.png", (screen_center_x, screen_center_y - 50)),
+            "exit": Button("assets/Exit.png", (screen_center_x, 600)),
+        }
+        self.texts = [prerender_message("Select a mode", (screen_center_x, 100), 64)]
+
+    def update(self, frame_input, clicked):
+        match self.clicked_button(frame_input, clicked):
+            case "exit":
+                return "title"
+            case "custom levels" | "normal levels" as mode:
+                session.start_run(mode)
+                return "pre round"
+        return None
+
+
+# allows the user to move the platform and launch the ball to start the round
+class PreRoundScene(Scene):
+    def enter(self):
+        loop_music("SoundFiles/level-background.mp3")
+        self.texts = [prerender_message("Press \"Space\" to to launch ball.", (screen_center_x, screen_center_y + 45),
+                                        32)]
+
+    def update(self, frame_input, clicked):
+        session.platform.player_move(frame_input.keys)
+
+        ball = session.balls[0]
+        ball.x = session.platform.rect.centerx
+        ball.y = session.platform.rect.top - ball_radius
+
+        # launches the ball when the user presses space
+        if frame_input.keys[pygame.K_SPACE]:
+            ball.x_vel = 0
+            ball.y_vel = -ball_speed
+            return "round running"
+        return None
+
+    def draw(self, surface):
+        session.draw(surface)
+        super().draw(surface)
+        render_score(surface, session.total_score, hud_refresh)
+
+
+class RoundRunningScene(Scene):
+    # updates ball and platform positions and handles collisions
+    def update(self, frame_input, clicked):
+        if frame_input.keys[pygame.K_p]:
+            return "paused"
+
+        # under load the impact sounds of a frame are coalesced into one and fewer particles are spawned
+        coalesce_effects = pacer.reduced(frame_pacing.coalesced_effects)
+        platform_hit = False
+        brick_hit = False
+        platform = session.platform
+        session.platform.player_move(frame_input.keys)
+        for ball in session.balls:
+            ball.update_pos()
+            if ball.rect.colliderect(platform.rect):
+                if not coalesce_effects:
+                    sounds["platform impact"].play()
+                platform_hit = True
+                ball.handle_rect_bounce(platform.rect, "platform")
+            for brick in session.bricks:
+                if brick[0].colliderect(ball.rect):
+                    if not coalesce_effects:
+                        sounds["brick impact"].play()
+                    brick_hit = True
+                    spawn_powerup(platform.rect.centerx, platform.rect.centery, ball_speed)
+                    ball.handle_rect_bounce(brick[0])
+                    session.bricks.remove(brick)
+                    session.recorder.brick_broken()
+                    if coalesce_effects:
+                        debris.emit(brick[0], colors.index(brick[1]), particles.debris_per_brick // 3)
+                    else:
+                        debris.emit(brick[0], colors.index(brick[1]))
+                    session.score += 1
+                    session.total_score += 1
+                    break
+            if ball.y > screen_dimensions[1]:
+                session.balls.remove(ball)
+        debris.update()
+        if coalesce_effects and platform_hit:
+            sounds["platform impact"].play()
+        if coalesce_effects and brick_hit:
+            sounds["brick impact"].play()
+
+        # progresses level
+        if session.score >= session.max_round_score:
+            session.reset_objects()
+            session.score = 0
+            session.current_round += 1
+            if session.current_round > 10:
+                return "win screen"
+            session.spawn_bricks()
+            return "pre round"
+
+        # player loses game if there are no more balls
+        if len(session.balls) == 0:
+            if session.endless:
+                session.high_score = history.is_high_score(session.total_score)
+            return "lose screen"
+        return None
+
+    def draw(self, surface):
+        session.draw(surface)
+        render_score(surface, session.total_score, hud_refresh)
+
+
+class PausedScene(Scene):
+    def enter(self):
+        self.texts = [prerender_message("Press \"Enter\" to unpause.", (screen_center_x, screen_center_y - 15), 32),
+                      prerender_message("Press \"Space\" to go to title", (screen_center_x, screen_center_y + 15), 32)]
+
+    def update(self, frame_input, clicked):
+        if frame_input.keys[pygame.K_RETURN]:
+            return "round running"
+        if frame_input.keys[pygame.K_SPACE]:
+            return "title"
+        return None
+
+    def draw(self, surface):
+        session.draw(surface)
+        super().draw(surface)
+        render_score(surface, session.total_score, hud_refresh)
+
+
+class LevelCreatorScene(Scene):
+    # LevelCreatorScene constructor
+    def __init__(self):
+        super().__init__()
+        self.editing_level = 1
+        self.current_color = 0
+        self.edit_brick_placeholders = [["e" for i in range(max_level_height)] for j in range(8)]
+        self.render_bricks = []
+        self.selecting_level_to_edit = True
+
+    def enter(self):
+        # establishes the lowest y level at which bricks can be placed
+        self.y_limit = block_height * max_level_height
+
+        # invisible rectangle on the area where bricks can be placed
+        self.place_rect = pygame.Rect(0, 0, block_width * 8, block_height * max_level_height)
+        self.select_level()
+
+    def exit(self):
+        super().exit()
+        self.edit_brick_placeholders = [["e" for i in range(max_level_height)] for j in range(8)]
+        self.render_bricks = []
+
+    # displays intermediate screen where the user can decide which custom level to edit
+    def select_level(self):
+        self.selecting_level_to_edit = True
+        self.edit_brick_placeholders = [["e" for i in range(max_level_height)] for j in range(8)]
+        self.render_bricks = []
+        self.buttons = {"exit": Button("assets/Exit.png", (screen_center_x, 600))}
+        self.texts = [prerender_message("Choose a level to edit (1-10) by\npressing the number keys.",
+                                        (screen_center_x, screen_center_y - 0), 32)]
+
+    # begins editing the custom level and pre-renders the information for how to edit it
+    def edit_level(self, level_num: int):
+        self.selecting_level_to_edit = False
+        self.editing_level = level_num
+        self.edit_brick_placeholders = get_edit_brick_placeholders(level_num)
+        self.render_bricks = get_render_bricks(self.edit_brick_placeholders)
+        self.buttons = {}
+
+        y_limit = self.y_limit
+        self.texts = [
+            prerender_message(f"Editing Level {level_num}", (screen_center_x, y_limit + 20), 32),
+            prerender_message("Press the number keys to change the color.", (screen_center_x, y_limit + 50), 20),
+            prerender_message("Press \"S\" to save level.", (screen_center_x, y_limit + 70), 20),
+            prerender_message("Press \"E\" to erase.", (screen_center_x, y_limit + 90), 20),
+            prerender_message("Press \"C\" to clear screen.", (screen_center_x, y_limit + 110), 20),
+            prerender_message("Press \"Enter\" to go back without saving.", (screen_center_x, y_limit + 130), 20),
+            prerender_message("Use the mouse to place bricks of the current color above the\nred line.",
+                              (screen_center_x, y_limit + 150), 20),
+            prerender_message("Current color: ", (screen_center_x - 30, screen_dimensions[1] - 110), 20),
+        ]
+
+    # saves the level the user has created in its "Maps/" file
+    def save_level(self):
+        level_file = open(f"{maps_directory}/CustomLevel-{self.editing_level}", "w")
+        to_write = ""
+        for y in range(max_level_height):
+            for x in range(8):
+                to_write += str(self.edit_brick_placeholders[x][y])
+            to_write += "\n"
+        level_file.write(to_write)
+        level_file.close()
+
+    def update(self, frame_input, clicked):
+        keys = frame_input.keys
+        if self.selecting_level_to_edit:
+            if self.clicked_button(frame_input, clicked) == "exit":
+                return "title"
+
+            # When the user presses a number key, begins editing the custom level associated with it
+            for i, key in enumerate(number_keys):
+                if keys[key]:
+                    self.edit_level(i + 1)
+            return None
+
+        # changes the working color if the user pressed a number key
+        for i, key in enumerate(number_keys):
+            if keys[key]:
+                self.current_color = i
+
+        # switches to eraser mode if the user presses "e"
+        if keys[pygame.K_e]:
+            self.current_color = "e"
+
+        # clears screen if user presses "c"
+        if keys[pygame.K_c]:
+            self.render_bricks = []
+            self.edit_brick_placeholders = [["e" for i in range(max_level_height)] for j in range(8)]
+
+        # returns to level edit selection without saving if the user presses "Enter"
+        if keys[pygame.K_RETURN]:
+            self.select_level()
+            return None
+
+        # saves the level the user has created if the user presses "s"
+        if keys[pygame.K_s]:
+            self.save_level()
+            self.select_level()
+            return None
+
+        # if the user has clicked within the placement area, a brick is created with the current color at the
+        # location of the click. holding the mouse on a cell that already has the current color adds nothing
+        if frame_input.mouse_down and self.place_rect.collidepoint(frame_input.mouse_pos):
+            x = int(frame_input.mouse_pos[0] // block_width)
+            y = int(frame_input.mouse_pos[1] // block_height)
+
+            if self.edit_brick_placeholders[x][y] != self.current_color:
+                self.edit_brick_placeholders[x][y] = self.current_color
+                self.render_bricks.append((pygame.Rect(x * block_width + 1, y * block_height + 1,
+                                                       block_width - 2, block_height - 2), self.current_color))
+        return None
+
+    def draw(self, surface):
+        super().draw(surface)
+        if self.selecting_level_to_edit:
+            return
+
+        pygame.draw.line(surface, "red", (0, self.y_limit), (screen_dimensions[0], self.y_limit), 1)
+
+        # displays the current color or eraser depending on what the user is using
+        if self.current_color != "e":
+            pygame.draw.rect(surface, colors[self.current_color], [240, 630, 25, 25])
+        else:
+            render_image(surface, "assets/Eraser.png", (245, 635), (25, 25))
+
+        # displays the bricks that have been placed
+        for brick in self.render_bricks:
+            if brick[1] == "e":
+                pygame.draw.rect(surface, "black", brick[0])
+            else:
+                pygame.draw.rect(surface, colors[brick[1]], brick[0])
+
+
+class EndScene(Scene):
+    # EndScene constructor. "outcome" is "win" or "lose"
+    def __init__(self, outcome: str):
+        super().__init__()
+        self.outcome = outcome
+
+    # stores the finished run in the run history
+    def enter(self):
+        history.submit_run(session.recorder.finish(session.total_score, self.outcome))
+        if self.outcome == "win":
+            sounds["win"].play()
+            stop_music()
+
+        self.buttons = {"exit": Button("assets/Exit.png", (screen_center_x, 600))}
+        if session.endless:
+            self.texts = [prerender_message("GAME OVER", screen_center, 64)]
+            if session.high_score:
+                self.texts.append(prerender_message(f"High score of {session.total_score}!",
+                                                    (screen_center[0], screen_center[1] + 60), 64))
+        else:
+            self.texts = [prerender_message(f"YOU {self.outcome.upper()}", screen_center, 64)]
+
+    def update(self, frame_input, clicked):
+        if self.clicked_button(frame_input, clicked) == "exit":
+            return "title"
+        return None
+
+
+class LeaderboardScene(Scene):
+    # LeaderboardScene constructor
+    def __init__(self):
+        super().__init__()
+        self.view = 0
+        self.shown = None
+
+    def enter(self):
+        history.refresh()
+        self.buttons = {"exit": Button("assets/Exit.png", (screen_center_x, 600))}
+        self.title = prerender_message("High Scores:", (screen_center_x, 100), 64)
+        self.shown = None
+        self.show_scores()
+
+    def exit(self):
+        super().exit()
+        self.title = None
+        self.shown = None
+
+    def update(self, frame_input, clicked):
+        if self.clicked_button(frame_input, clicked) == "exit":
+            return "title"
+
+        # switches between the leaderboard views with the arrow keys
+        if pygame.K_LEFT in frame_input.key_presses:
+            self.view = (self.view - 1) % len(run_history.leaderboard_views)
+        if pygame.K_RIGHT in frame_input.key_presses:
+            self.view = (self.view + 1) % len(run_history.leaderboard_views)
+        self.show_scores()
+        return None
+
+    # re-renders the scores only when the view or the cached scores from the run history have changed
+    def show_scores(self):
+        view = run_history.leaderboard_views[self.view]
+        scores = history.leaderboard(view)
+        if self.shown != (view, scores):
+            self.shown = (view, scores)
+            if scores is None:
+                message = "Loading..."
+            else:
+                message = "\n".join(f"{i + 1}:        {num}" for i, num in enumerate(scores))
+            self.texts = [self.title,
+                          prerender_message(f"< {view.title()} >", (screen_center_x, 150), 32),
+                          prerender_message(message, (screen_center_x, screen_center_y - 150), 32)]
+
+
+class InfoScene(Scene):
+    def enter(self):
+        self.buttons = {"exit": Button("assets/Exit.png", (screen_center_x, 600))}
+        self.texts = [prerender_message("How to play.", (screen_center_x, 100), 64),
+                      prerender_message(info, (screen_center_x, 160), 20)]
+
+    def update(self, frame_input, clicked):
+        if self.clicked_button(frame_input, clicked) == "exit":
+            return "title"
+        return None
 
 
 # entity info
 #########################################################
 ball_speed = 6
-balls = [Ball(0, 0, 0, 0), ]
-platform = Platform(175, screen_dimensions[1] * 15 / 16,
-                    default_platform_dimensions[0], default_platform_dimensions[1],
-                    platform_speed)
-edit_brick_placeholders = [["e" for i in range(max_level_height)] for j in range(8)]
-render_bricks = []
+debris = particles.ParticleSystem(colors, screen_dimensions, seed=input_source.seed)
+session = Session()
 #########################################################
 
-# score and round information
+# score display information
 #########################################################
-current_round = 1
-score = 0
-total_score = 0
-max_round_score = current_round * 8
-current_color = 0
+score_hud = {"value": None, "surface": None, "age": 0}
+hud_refresh_frames = 10
+hud_refresh = 1
+#########################################################
+
+# run history
+#########################################################
+# exported replays are kept out of the real run history
+if exporter is None:
+    history = run_history.RunHistory()
+else:
+    history = run_history.RunHistory(":memory:")
 #########################################################
 
 # sounds
 #########################################################
-brick_impact = pygame.mixer.Sound("SoundFiles/brick-impact.wav")
-platform_impact = pygame.mixer.Sound("SoundFiles/platform-impact.wav")
-win = pygame.mixer.Sound("SoundFiles/win.wav")
+sound_files = {"brick impact": "SoundFiles/brick-impact.wav", "platform impact": "SoundFiles/platform-impact.wav",
+               "win": "SoundFiles/win.wav"}
+sounds = {name: pygame.mixer.Sound(path) for name, path in sound_files.items()}
+now_playing = {"path": None}
 #########################################################
 
-# game state booleans to determine what chunk of code to run
-loop_music("SoundFiles/menu-background.wav")
+# reloads a changed file into the caches and hot-swaps it into the current scene without restarting the game. a file
+# that fails to load raises before anything cached is replaced, so the game keeps the old version
+def reload_file(path: str):
+    if path.startswith("assets/"):
+        images = {key: pygame.transform.scale(pygame.image.load(path).convert(), key[1])
+                  for key in loaded_images if key[0] == path}
+        loaded_images.update(images)
+        if game_state != "off":
+            scene.reload_images()
+    elif path.startswith("SoundFiles/"):
+        sounds.update({name: pygame.mixer.Sound(path) for name, sound_path in sound_files.items() if sound_path == path})
+
+        # the track stays marked as playing if it fails to load, so the next change to it is tried again
+        if now_playing["path"] == path:
+            now_playing["path"] = None
+            try:
+                loop_music(path)
+            finally:
+                now_playing["path"] = path
+
+    # the brick field is only swapped between launches so a ball never ends up inside a brick
+    elif path.startswith("Maps/") and game_state == "pre round" and session.level_path() == path:
+        session.load_bricks()
+        session.score = 0
+
+
+# one scene for every game state
+#########################################################
+scenes = {
+    "title": TitleScene(),
+    "level select": LevelSelectScene(),
+    "pre round": PreRoundScene(),
+    "round running": RoundRunningScene(),
+    "paused": PausedScene(),
+    "level creator": LevelCreatorScene(),
+    "leaderboard": LeaderboardScene(),
+    "info": InfoScene(),
+    "win screen": EndScene("win"),
+    "lose screen": EndScene("lose"),
+}
 game_state = "title"
-endless = False
-custom = False
-selecting_level_to_edit = False
-high_score = False
+scene = scenes[game_state]
+scene.enter()
 can_click = True
+#########################################################
+
+# hot reload
+#########################################################
+if options.watch:
+    watcher = hot_reload.FileWatcher()
+else:
+    watcher = None
+#########################################################
+
+# memory telemetry
+#########################################################
+if options.memory_report is None:
+    telemetry = None
+else:
+    telemetry = memory_telemetry.MemoryTelemetry(options.memory_report)
+    telemetry.watch("balls", lambda: len(session.balls))
+    telemetry.watch("bricks", lambda: len(session.bricks))
+    telemetry.watch("render_bricks", lambda: len(scenes["level creator"].render_bricks))
+    telemetry.watch("loaded_images", lambda: len(loaded_images))
+    telemetry.watch("particles", lambda: debris.count)
+    telemetry.snapshot("start")
+#########################################################
 
 while game_state != "off":
+    previous_game_state = game_state
+    hud_refresh = hud_refresh_frames if pacer.reduced(frame_pacing.reduced_hud) else 1
+
+    # reloads the files that have changed and logs how long it took from the file being saved to it being in the game
+    if watcher is not None:
+        for path, mtime in watcher.poll():
+            reload_start = time.perf_counter()
+            try:
+                reload_file(path)
+            except (pygame.error, ValueError, OSError) as error:
+                print(f"could not reload {path}, keeping the old version until it changes again: {error}",
+                      file=sys.stderr)
+                continue
+            print(f"reloaded {path} in {(time.perf_counter() - reload_start) * 1000:.1f} ms "
+                  f"({(time.time() - mtime) * 1000:.0f} ms after it was saved)", file=sys.stderr)
+
+    # input is read as late as possible, right before the scene moves the paddle and the balls
+    if options.late_input and exporter is None:
+        dt = pacer.wait_for_input(input_source.collect)
+    frame_input = input_source.poll()
+    latency.sampled(frame_input.event_times)
+
     clicked = False
-    if pygame.mouse.get_pressed(3)[0]:
+    if frame_input.mouse_down:
         if can_click:
             clicked = True
             can_click = False
@@ -470,442 +949,64 @@ while game_state != "off":
         can_click = True
         clicked = False
 
-    mouse_pos = pygame.mouse.get_pos()
-    keys = pygame.key.get_pressed()
     screen.fill((0, 0, 0))
 
     # quits the game when the user pressed the "X" button or the escape key
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            game_state = "off"
-    if keys[pygame.K_ESCAPE]:
-        game_state = "off"
-
-    # events if a game has started
-    match game_state:
-        case "level creator":
-            # displays intermediate screen where the user can decide which custom level to edit
-            if selecting_level_to_edit:
-                render_message(screen, "Choose a level to edit (1-10) by\npressing the number keys.",
-                               (screen_center_x, screen_center_y - 0), 32)
-
-                exit_level_creator_rect = render_image(screen, "assets/Exit.png",
-                                                       (screen_center_x, 600), (200, 50)).get_rect()
-                exit_level_creator_rect.center = (screen_center_x, 600)
-
-                if exit_level_creator_rect.collidepoint(mouse_pos) and clicked:
-                    game_state = "title"
-
-                # When the user presses a number key, begins editing the custom level associated with it
-                #########################################################
-                if keys[pygame.K_1]:
-                    selecting_level_to_edit = False
-                    editing_level = 1
-                    edit_brick_placeholders = get_edit_brick_placeholders(1)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                if keys[pygame.K_2]:
-                    selecting_level_to_edit = False
-                    editing_level = 2
-                    edit_brick_placeholders = get_edit_brick_placeholders(2)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                if keys[pygame.K_3]:
-                    selecting_level_to_edit = False
-                    editing_level = 3
-                    edit_brick_placeholders = get_edit_brick_placeholders(3)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                if keys[pygame.K_4]:
-                    selecting_level_to_edit = False
-                    editing_level = 4
-                    edit_brick_placeholders = get_edit_brick_placeholders(4)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                if keys[pygame.K_5]:
-                    selecting_level_to_edit = False
-                    editing_level = 5
-                    edit_brick_placeholders = get_edit_brick_placeholders(5)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                if keys[pygame.K_6]:
-                    selecting_level_to_edit = False
-                    editing_level = 6
-                    edit_brick_placeholders = get_edit_brick_placeholders(6)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                if keys[pygame.K_7]:
-                    selecting_level_to_edit = False
-                    editing_level = 7
-                    edit_brick_placeholders = get_edit_brick_placeholders(7)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                if keys[pygame.K_8]:
-                    selecting_level_to_edit = False
-                    editing_level = 8
-                    edit_brick_placeholders = get_edit_brick_placeholders(8)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                if keys[pygame.K_9]:
-                    selecting_level_to_edit = False
-                    editing_level = 9
-                    edit_brick_placeholders = get_edit_brick_placeholders(9)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                if keys[pygame.K_0]:
-                    selecting_level_to_edit = False
-                    editing_level = 10
-                    edit_brick_placeholders = get_edit_brick_placeholders(10)
-                    render_bricks = get_render_bricks(edit_brick_placeholders)
-                #########################################################
-
-            else:
-                # establishes the lowest y level at which bricks can be placed
-                y_limit = block_height * max_level_height
-
-                # displays information for how to edit the level
-                #########################################################
-                pygame.draw.line(screen, "red", (0, y_limit),
-                                 (screen_dimensions[0], y_limit), 1)
-                render_message(screen, f"Editing Level {editing_level}",
-                               (screen_center_x, y_limit + 20), 32)
-                render_message(screen, "Press the number keys to change the color.",
-                               (screen_center_x, y_limit + 50), 20)
-                render_message(screen, "Press \"S\" to save level.",
-                               (screen_center_x, y_limit + 70), 20)
-                render_message(screen, "Press \"E\" to erase.",
-                               (screen_center_x, y_limit + 90), 20)
-                render_message(screen, "Press \"C\" to clear screen.",
-                               (screen_center_x, y_limit + 110), 20)
-                render_message(screen, "Press \"Enter\" to go back without saving.",
-                               (screen_center_x, y_limit + 130), 20)
-                render_message(screen, "Use the mouse to place bricks of the current color above the\nred line.",
-                               (screen_center_x, y_limit + 150), 20)
-                render_message(screen, "Current color: ",
-                               (screen_center_x - 30, screen_dimensions[1] - 110), 20)
-                #########################################################
-
-                # displays the current color or eraser depending on what the user is using
-                if current_color != "e":
-                    pygame.draw.rect(screen, colors[current_color], [240, 630, 25, 25])
-                else:
-                    render_image(screen, "assets/Eraser.png", (245, 635), (25, 25))
-
-                # invisible rectangle on the area where bricks can be placed
-                place_rect = pygame.Rect(0, 0, block_width * 8, block_height * max_level_height)
-
-                # changes the working color if the user pressed a number key
-                #########################################################
-                if keys[pygame.K_1]:
-                    current_color = 0
-                if keys[pygame.K_2]:
-                    current_color = 1
-                if keys[pygame.K_3]:
-                    current_color = 2
-                if keys[pygame.K_4]:
-                    current_color = 3
-                if keys[pygame.K_5]:
-                    current_color = 4
-                if keys[pygame.K_6]:
-                    current_color = 5
-                if keys[pygame.K_7]:
-                    current_color = 6
-                if keys[pygame.K_8]:
-                    current_color = 7
-                if keys[pygame.K_9]:
-                    current_color = 8
-                if keys[pygame.K_0]:
-                    current_color = 9
-                #########################################################
-
-                # switches to eraser mode if the user presses "e"
-                if keys[pygame.K_e]:
-                    current_color = "e"
-
-                # clears screen if user presses "c"a
-                if keys[pygame.K_c]:
-                    render_bricks = []
-                    edit_brick_placeholders = [["e" for i in range(max_level_height)] for j in range(8)]
-
-                # returns to level edit selection without saving if the user presses "Enter"
-                if keys[pygame.K_RETURN]:
-                    selecting_level_to_edit = True
-
-                # saves the level the user has created if the user presses "s"
-                if keys[pygame.K_s]:
-                    selecting_level_to_edit = True
-                    level_file = open(f"Maps/CustomLevel-{editing_level}", "w")
-                    to_write = ""
-                    for y in range(max_level_height):
-                        for x in range(8):
-                            to_write += str(edit_brick_placeholders[x][y])
-                        to_write += "\n"
-                    level_file.write(to_write)
-                    level_file.close()
-                    edit_brick_placeholders = [["e" for i in range(max_level_height)] for j in range(8)]
-                    render_bricks = []
-
-                # if the user has clicked within the placement area, a brick is created with the current color at the
-                # location of the click
-                if pygame.mouse.get_pressed(3)[0] and place_rect.collidepoint(mouse_pos):
-                    x = int(mouse_pos[0] // block_width)
-                    y = int(mouse_pos[1] // block_height)
-
-                    edit_brick_placeholders[x][y] = current_color
-                    render_bricks.append((pygame.Rect(x * block_width + 1, y * block_height + 1,
-                                                      block_width - 2, block_height - 2), current_color))
-
-                # displays the bricks that have been placed
-                for brick in render_bricks:
-                    if brick[1] == "e":
-                        pygame.draw.rect(screen, "black", brick[0])
-                    else:
-                        pygame.draw.rect(screen, colors[brick[1]], brick[0])
-
-        case "round running":
-            if keys[pygame.K_p]:
-                game_state = "paused"
-
-            # updates ball and platform positions, handles collisions, and draws objects on screen
-            #########################################################
-            platform.player_move(keys)
-            for ball in balls:
-                ball.update_pos()
-                if ball.rect.colliderect(platform.rect):
-                    platform_impact.play()
-                    ball.handle_rect_bounce(platform.rect, "platform")
-                collided = False
-                for brick in bricks:
-                    if brick[0].colliderect(ball.rect):
-                        brick_impact.play()
-                        collided = True
-                        spawn_powerup(platform.rect.centerx, platform.rect.centery, ball_speed)
-                        ball.handle_rect_bounce(brick[0])
-                        if brick in bricks:
-                            bricks.remove(brick)
-                            score += 1
-                            total_score += 1
-                    if collided:
-                        break
-                    else:
-                        pygame.draw.rect(screen, brick[1], brick[0])
-                if ball.y > screen_dimensions[1]:
-                    balls.remove(ball)
-                else:
-                    ball.draw(screen)
-            platform.draw(screen)
-            #########################################################
-
-            # progresses level
-            #########################################################
-            if score >= max_round_score:
-                platform.reset()
-                score = 0
-                current_round += 1
-                game_state = "pre round"
-
-                balls = [balls[0]]
-                if current_round > 10:
-                    win.play()
-                    game_state = "win screen"
-                    pygame.mixer.music.unload()
-                else:
-                    if endless:
-                        bricks = random_spawn_bricks()
-                        max_round_score = len(bricks)
-                    elif not custom:
-                        max_round_score += 8
-                        bricks = level_spawn_bricks(current_round, custom)
-                    else:
-                        bricks = level_spawn_bricks(current_round, custom)
-                        max_round_score = len(bricks)
-            #########################################################
-
-            # player loses game if there are no more balls
-            if len(balls) == 0:
-                if endless:
-                    scores = add_high_score(total_score)
-                    if total_score in scores:
-                        high_score = True
-                    else:
-                        high_score = False
-                game_state = "lose screen"
-
-            # displays score
-            render_message(screen, f"Score: {total_score}", (100, screen_dimensions[1] - 15), 32)
-
-        case "pre round":   # allows the user to move the platform and launch the ball to start the round
-            render_message(screen, "Press \"Space\" to to launch ball.", (screen_center_x, screen_center_y + 45), 32)
-            render_message(screen, f"Score: {total_score}", (100, screen_dimensions[1] - 15), 32)
-
-            platform.player_move(keys)
-
-            balls[0].x = platform.rect.centerx
-            balls[0].y = platform.rect.top - ball_radius
-
-            # launches the ball when the user presses space
-            if keys[pygame.K_SPACE]:
-                game_state = "round running"
-                balls[0].x_vel = 0
-                balls[0].y_vel = -ball_speed
-
-            platform.draw(screen)
-            balls[0].draw(screen)
-            for brick in bricks:
-                pygame.draw.rect(screen, brick[1], brick[0])
-
-        case "level select":
-            # displays buttons and positions rect objects to detect when the buttons are clicked
-            #########################################################
-            render_message(screen, "Select a mode", (screen_center_x, 100), 64)
-            custom_levels_rect = render_image(screen, "assets/Custom-Levels.png",
-                                              (screen_center_x, screen_center_y + 50), (200, 50)).get_rect()
-            custom_levels_rect.center = (screen_center_x, screen_center_y + 50)
-
-            normal_levels_rect = render_image(screen, "assets/Normal-Levels.png",
-                                              (screen_center_x, screen_center_y - 50), (200, 50)).get_rect()
-            normal_levels_rect.center = (screen_center_x, screen_center_y - 50)
-
-            exit_level_select_rect = render_image(screen, "assets/Exit.png",
-                                              (screen_center_x, 600), (200, 50)).get_rect()
-            exit_level_select_rect.center = (screen_center_x, 600)
-            #########################################################
-
-            # switches the game state based on which (if any) button the user presses
-            #########################################################
-            if exit_level_select_rect.collidepoint(mouse_pos) and clicked:
-                game_state = "title"
-            if custom_levels_rect.collidepoint(mouse_pos) and clicked:
-                loop_music("SoundFiles/level-background.mp3")
-                game_state = "pre round"
-                custom = True
-                bricks = level_spawn_bricks(current_round, custom)
-                max_round_score = len(bricks)
-            if normal_levels_rect.collidepoint(mouse_pos) and clicked:
-                loop_music("SoundFiles/level-background.mp3")
-                game_state = "pre round"
-                custom = False
-                bricks = level_spawn_bricks(current_round, custom)
-            #########################################################
-
-        case "paused":
-            platform.draw(screen)
-            for ball in balls:
-                ball.draw(screen)
-            for brick in bricks:
-                pygame.draw.rect(screen, brick[1], brick[0])
-
-            render_message(screen, "Press \"Enter\" to unpause.", (screen_center_x, screen_center_y - 15), 32)
-            render_message(screen, "Press \"Space\" to go to title", (screen_center_x, screen_center_y + 15), 32)
-            render_message(screen, f"Score: {total_score}", (100, screen_dimensions[1] - 15), 32)
-
-            if keys[pygame.K_RETURN]:
-                game_state = "round running"
-            if keys[pygame.K_SPACE]:
-                balls = [balls[0]]
-                game_state = "title"
-                loop_music("SoundFiles/menu-background.wav")
-                platform.reset()
-
-        case "title":  # events if the player is on the title screen
-
-            # renders buttons and images and positions rect objects to detect when a button is pressed
-            #########################################################
-            render_image(screen, "assets/title-screen.png", (screen_center_x + 70, screen_center_y + 110),
-                         screen_dimensions)
-            play_levels_rect = render_image(screen, "assets/Play-Levels.png",
-                                            (screen_center_x, screen_center_y - 120), (200, 50)).get_rect()
-            play_levels_rect.center = (screen_center_x, screen_center_y - 120)
-
-            play_endless_rect = render_image(screen, "assets/Play-Endless.png",
-                                             (screen_center_x, screen_center_y - 50), (200, 50)).get_rect()
-            play_endless_rect.center = (screen_center_x, screen_center_y - 50)
-
-            level_creator_rect = render_image(screen, "assets/Level-Creator.png",
-                                              (screen_center_x, screen_center_y + 20), (200, 50)).get_rect()
-            level_creator_rect.center = (screen_center_x, screen_center_y + 20)
-
-            high_scores_rect = render_image(screen, "assets/High-Scores.png",
-                                            (screen_center_x, screen_center_y + 90), (200, 50)).get_rect()
-            high_scores_rect.center = (screen_center_x, screen_center_y + 90)
-
-            info_rect = render_image(screen, "assets/Info.png",
-                                     (screen_center_x, screen_center_y + 160), (200, 50)).get_rect()
-            info_rect.center = (screen_center_x, screen_center_y + 160)
-
-            quit_rect = render_image(screen, "assets/Quit.png", (screen_center_x, screen_center_y + 230),
-                                     (200, 50)).get_rect()
-            quit_rect.center = (screen_center_x, screen_center_y + 230)
-            #########################################################
-
-            render_message(screen, "Atari Breakout", [screen_center_x, 100], 64)
-
-            # Detects if the player has hit any of the buttons and if so, switches the game state
-            #########################################################
-            if play_levels_rect.collidepoint(mouse_pos) and clicked:
-                game_state = "level select"
-                score = 0
-                total_score = 0
-                current_round = 1
-                endless = False
-            if play_endless_rect.collidepoint(mouse_pos) and clicked:
-                loop_music("SoundFiles/level-background.mp3")
-                game_state = "pre round"
-                bricks = random_spawn_bricks()
-                score = 0
-                total_score = 0
-                current_round = 1
-                max_round_score = len(bricks)
-                endless = True
-            if high_scores_rect.collidepoint(mouse_pos) and clicked:
-                game_state = "leaderboard"
-            if info_rect.collidepoint(mouse_pos) and clicked:
-                game_state = "info"
-            if quit_rect.collidepoint(mouse_pos) and clicked:
-                game_state = "off"
-            if level_creator_rect.collidepoint(mouse_pos) and clicked:
-                game_state = "level creator"
-                selecting_level_to_edit = True
-            #########################################################
-
-        case "win screen" | "lose screen":
-            exit_game_end_rect = render_image(screen, "assets/Exit.png",
-                                              (screen_center_x, 600), (200, 50)).get_rect()
-            exit_game_end_rect.center = (screen_center_x, 600)
-
-            if exit_game_end_rect.collidepoint(mouse_pos) and clicked:
-                platform.reset()
-                loop_music("SoundFiles/menu-background.wav")
-                game_state = "title"
-                balls = [Ball(0, 0, 0, 0), ]
-
-            if endless:
-                render_message(screen, "GAME OVER", screen_center, 64)
-                if high_score:
-                    render_message(screen, f"High score of {total_score}!", (screen_center[0], screen_center[1] + 60), 64)
-            else:
-                render_message(screen, f"YOU {game_state[:4].upper()}", screen_center, 64)
-
-        case "leaderboard":
-            # gets scores from the "Endless-High_Scores" file and displays them on the screen
-            #########################################################
-            scores = add_high_score(-1)
-            message = ""
-            for i, num in enumerate(scores):
-                message += f"{i + 1}:        {num}\n"
-            message = message[:len(message) - 1]
-            render_message(screen, "High Scores:", (screen_center_x, 100), 64)
-            render_message(screen, message, (screen_center_x, screen_center_y - 150), 32)
-            #########################################################
-
-            exit_leaderboard_rect = render_image(screen, "assets/Exit.png",
-                                              (screen_center_x, 600), (200, 50)).get_rect()
-            exit_leaderboard_rect.center = (screen_center_x, 600)
-
-            if exit_leaderboard_rect.collidepoint(mouse_pos) and clicked:
-                game_state = "title"
-
-        case "info":
-            render_message(screen, "How to play.", (screen_center_x, 100), 64)
-            render_message(screen, info,(screen_center_x, 160), 20)
-
-            exit_info_rect = render_image(screen, "assets/Exit.png",
-                                          (screen_center_x, 600), (200, 50)).get_rect()
-            exit_info_rect.center = (screen_center_x, 600)
-
-            if exit_info_rect.collidepoint(mouse_pos) and clicked:
-                game_state = "title"
-
-    pygame.display.flip()
-    dt = clock.tick(60)
+    if frame_input.quit_pressed or frame_input.keys[pygame.K_ESCAPE]:
+        next_state = "off"
+    else:
+        next_state = scene.update(frame_input, clicked)
+
+    # switches scenes. the new scene is set up before its first frame is drawn
+    if next_state is not None:
+        scene.exit()
+        game_state = next_state
+        if game_state != "off":
+            scene = scenes[game_state]
+            scene.enter()
+    if game_state != "off":
+        scene.draw(screen)
+
+    # snapshots memory whenever the game state changes
+    if telemetry is not None:
+        telemetry.tick()
+        if game_state != previous_game_state:
+            telemetry.snapshot(f"{previous_game_state} -> {game_state}")
+
+    # shows the frame pacing stats in the top right corner
+    if options.pacing_stats:
+        stats = pacer.stats()
+        render_message(screen, f"{stats['tier']}  {stats['fps']:.0f} fps\n"
+                               f"work {stats['average work ms']:.1f}/{stats['max work ms']:.1f} ms"
+                               f"{'  busy' if stats['busy loop'] else ''}",
+                       (screen_dimensions[0] - 90, 10), 18)
+
+    # shows the input to display latency under the frame pacing stats
+    if options.latency_stats:
+        stats = latency.stats()
+        render_message(screen, f"input p50 {stats['p50 ms']:.1f} ms\np99 {stats['p99 ms']:.1f} ms",
+                       (screen_dimensions[0] - 90, 50), 18)
+
+    # exported frames are written as fast as they can be drawn instead of being paced to 60 fps. in late input mode the
+    # wait happens before the input is read instead of here
+    if exporter is None:
+        pacer.flip()
+        latency.flipped()
+        if not options.late_input:
+            dt = pacer.tick(input_source.collect if options.latency_stats else None)
+    else:
+        exporter.write(screen)
+
+if exporter is not None:
+    exporter.close()
+    shutil.rmtree(os.path.dirname(maps_directory))
+if telemetry is not None:
+    telemetry.close()
+if options.pacing_stats:
+    print(pacer.stats(), file=sys.stderr)
+if options.latency_stats:
+    print(latency.stats(refresh=True), file=sys.stderr)
+if watcher is not None:
+    watcher.close()
+input_source.close()
+history.close()
@@ -0,0 +1,102 @@
+# import libraries
+import sys
+import time
+import tracemalloc
+
+# telemetry variables
+traceback_depth = 1
+top_sites = 10
+frames_per_sample = 60
+growth_warning_samples = 10     # consecutive samples a counter has to keep reaching new highs before a warning
+
+
+# tracks memory while the game is running. "tracemalloc" snapshots are taken whenever the game state changes and are
+# compared with the previous snapshot, and the registered object counters are sampled every "frames_per_sample" frames
+# to catch collections that keep growing
+class MemoryTelemetry:
+    # MemoryTelemetry constructor
+    def __init__(self, report_path: str):
+        self.report_path = report_path
+        self.counters = {}
+        self.samples = {}
+        self.streaks = {}
+        self.warned = set()
+        self.report = []
+        self.frame = 0
+        self.started_at = time.time()
+        self.previous = None
+
+        tracemalloc.start(traceback_depth)
+
+    # registers a counter. "get_count" is called on every sample and has to return an int
+    def watch(self, name: str, get_count):
+        self.counters[name] = get_count
+        self.samples[name] = []
+        self.streaks[name] = 0
+
+    # counts a frame and samples the counters if it is time to
+    def tick(self):
+        self.frame += 1
+        if self.frame % frames_per_sample == 0:
+            self.sample()
+
+    # records every counter and warns about the counters that have kept growing for "growth_warning_samples" samples
+    def sample(self):
+        for name, get_count in self.counters.items():
+            count = get_count()
+            samples = self.samples[name]
+            if samples and count > max(samples):
+                self.streaks[name] += 1
+            else:
+                self.streaks[name] = 0
+            samples.append(count)
+
+            if self.streaks[name] >= growth_warning_samples and name not in self.warned:
+                self.warned.add(name)
+                self.log(f"WARNING frame {self.frame}: \"{name}\" has grown for {self.streaks[name]} samples in a row "
+                         f"and is now {count}")
+                print(self.report[-1], file=sys.stderr)
+
+    # takes a snapshot, records the top allocation sites and the growth since the previous snapshot. the telemetry's
+    # own report lines are left out so they do not hide the game's allocations
+    def snapshot(self, label: str):
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+
+        self.log(f"== {label} (frame {self.frame}, {time.time() - self.started_at:.1f}s) "
+                 f"traced {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB")
+        self.log("  counters: " + ", ".join(f"{name}={get_count()}" for name, get_count in self.counters.items()))
+        self.log("  top allocation sites:")
+        for stat in snapshot.statistics("lineno")[:top_sites]:
+            self.log(f"    {stat}")
+
+        if self.previous is not None:
+            self.log("  growth since previous snapshot:")
+            growth = [stat for stat in snapshot.compare_to(self.previous, "lineno") if stat.size_diff > 0]
+            for stat in growth[:top_sites]:
+                self.log(f"    {stat}")
+        self.previous = snapshot
+
+    def log(self, line: str):
+        self.report.append(line)
+
+    # writes the report to "report_path" with a summary of every counter at the end
+    def write_report(self):
+        self.log("== counters")
+        for name, samples in self.samples.items():
+            if samples:
+                self.log(f"  {name}: last {samples[-1]}, max {max(samples)}, samples {len(samples)}"
+                         f"{', GROWING' if name in self.warned else ''}")
+
+        report_file = open(self.report_path, "w")
+        report_file.write("\n".join(self.report) + "\n")
+        report_file.close()
+
+    def close(self):
+        self.snapshot("exit")
+        self.write_report()
+        tracemalloc.stop()
@@ -0,0 +1,100 @@
+# import libraries
+import numpy
+import pygame
+
+# particle variables
+max_particles = 5000
+debris_per_brick = 12
+particle_lifetime = 45      # in frames
+particle_gravity = 0.15
+particle_size = 2
+
+
+# stores every live particle in preallocated arrays so updating and drawing them is done in a few numpy operations
+# instead of a python loop. live particles are always packed into the first "count" slots of the arrays
+class ParticleSystem:
+    # ParticleSystem constructor
+    def __init__(self, palette, bounds: [int, int], capacity: int = max_particles, seed: int = None):
+        self.palette = tuple(pygame.Color(color) for color in palette)
+        self.bounds = bounds
+        self.capacity = capacity
+        self.count = 0
+        self.pos = numpy.zeros((capacity, 2), numpy.float32)
+        self.vel = numpy.zeros((capacity, 2), numpy.float32)
+        self.life = numpy.zeros(capacity, numpy.int16)
+        self.color = numpy.zeros(capacity, numpy.uint8)
+        self.rng = numpy.random.default_rng(seed)
+        self.mapped_colors = None
+        self.mapped_format = None
+
+    # spawns "amount" particles spread over the rect. if the particle budget is used up the extra particles are dropped
+    def emit(self, rect: pygame.Rect, color_index: int, amount: int = debris_per_brick):
+        amount = min(amount, self.capacity - self.count)
+        if amount <= 0:
+            return
+
+        new = slice(self.count, self.count + amount)
+        self.pos[new, 0] = self.rng.uniform(rect.left, rect.right, amount)
+        self.pos[new, 1] = self.rng.uniform(rect.top, rect.bottom, amount)
+        self.vel[new] = self.rng.normal(0, 1.5, (amount, 2))
+        self.vel[new, 1] -= 1
+        self.life[new] = self.rng.integers(particle_lifetime // 2, particle_lifetime, amount)
+        self.color[new] = color_index
+        self.count += amount
+
+    # moves every live particle one frame and removes the ones that have expired or left the screen
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+
+        self.vel[:n, 1] += particle_gravity
+        self.pos[:n] += self.vel[:n]
+        self.life[:n] -= 1
+
+        alive = ((self.life[:n] > 0) & (self.pos[:n, 0] >= 0) & (self.pos[:n, 0] < self.bounds[0])
+                 & (self.pos[:n, 1] < self.bounds[1]))
+        self.compact(alive)
+
+    # fills the slots of dead particles near the front with live particles from the back so that the live particles
+    # stay packed without shifting the whole array
+    def compact(self, alive: numpy.ndarray):
+        n = self.count
+        new_count = int(numpy.count_nonzero(alive))
+        if new_count == n:
+            return
+
+        holes = numpy.flatnonzero(~alive[:new_count])
+        movers = numpy.flatnonzero(alive[new_count:]) + new_count
+        for array in (self.pos, self.vel, self.life, self.color):
+            array[holes] = array[movers]
+        self.count = new_count
+
+    def clear(self):
+        self.count = 0
+
+    # writes the particles straight into the pixels of the surface as small squares
+    def draw(self, surface: pygame.Surface):
+        n = self.count
+        if n == 0:
+            return
+
+        # palette colors are mapped to the surface's pixel format once and reused until the format changes
+        pixel_format = (surface.get_bitsize(), surface.get_masks())
+        if self.mapped_format != pixel_format:
+            self.mapped_colors = numpy.array([surface.map_rgb(color) for color in self.palette], numpy.uint32)
+            self.mapped_format = pixel_format
+
+        width, height = surface.get_size()
+        xs = self.pos[:n, 0].astype(numpy.intp)
+        ys = self.pos[:n, 1].astype(numpy.intp)
+        on_screen = (xs >= 0) & (xs <= width - particle_size) & (ys >= 0) & (ys <= height - particle_size)
+        xs = xs[on_screen]
+        ys = ys[on_screen]
+        values = self.mapped_colors[self.color[:n][on_screen]]
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        for dx in range(particle_size):
+            for dy in range(particle_size):
+                pixels[xs + dx, ys + dy] = values
+        del pixels
@@ -0,0 +1,220 @@
+# import libraries
+import math
+import pygame
+
+# physics variables. "main.py" uses the same values
+screen_dimensions = (400, 750)
+screen_center_x = screen_dimensions[0] / 2
+ball_radius = 8
+platform_speed = 5
+
+
+class Ball:
+    # Ball constructor
+    def __init__(self, x: int | float, y: int | float, x_vel: int | float, y_vel: int | float, color: tuple = None):
+        self.x = x
+        self.y = y
+        self.x_vel = x_vel
+        self.y_vel = y_vel
+        self.rect = pygame.Rect([x - ball_radius, y - ball_radius], [2 * ball_radius, 2 * ball_radius])
+        if color is None:
+            self.color = (255, 0, 0)
+        else:
+            self.color = color
+
+    # handles the collision of the ball against a rectangle on the screen and decides how to bounce the ball.
+    def handle_rect_bounce(self, rect, object_hit="brick"):
+
+        # Sets velocity based on which side of the brick the ball has hit
+        if self.x < rect.centerx:  # ball left of brick
+
+            if self.y < rect.centery:  # ball to the top left of brick
+
+                new_vel = get_new_vel(self, [-1, -1], rect, object_hit)
+
+                self.x_vel, self.y_vel = new_vel[0], new_vel[1]
+            else:  # ball to the bottom left of brick
+
+                new_vel = get_new_vel(self, [-1, 1], rect, object_hit)
+
+                self.x_vel, self.y_vel = new_vel[0], new_vel[1]
+        else:  # ball right of brick
+
+            if self.y < rect.centery:  # ball to the top right of brick
+
+                new_vel = get_new_vel(self, [1, -1], rect, object_hit)
+
+                self.x_vel, self.y_vel = new_vel[0], new_vel[1]
+            else:  # ball to the bottom right of brick
+
+                new_vel = get_new_vel(self, [1, 1], rect, object_hit)
+
+                self.x_vel, self.y_vel = new_vel[0], new_vel[1]
+
+    def set_pos(self, x, y):
+        self.x = x
+        self.y = y
+
+        if self.x - ball_radius < 0:
+            self.x = ball_radius
+            self.x_vel *= -1
+        if self.x + ball_radius > screen_dimensions[0]:
+            self.x = screen_dimensions[0] - ball_radius
+            self.x_vel *= -1
+        if self.y - ball_radius < 0:
+            self.y = ball_radius
+            self.y_vel *= -1
+        if self.y + ball_radius > screen_dimensions[1]:
+            self.y = screen_dimensions[1] - ball_radius
+            self.y_vel *= -1
+
+        self.rect.center = [self.x, self.y]
+
+    # updates the ball's position according to it's speed
+    def update_pos(self):
+        self.x += self.x_vel
+        self.y += self.y_vel
+
+        # puts the ball back on the screen and bounces it if the ball has hit a wall
+        if self.x - ball_radius < 0:
+            self.x = ball_radius
+            self.x_vel *= -1
+        if self.x + ball_radius > screen_dimensions[0]:
+            self.x = screen_dimensions[0] - ball_radius
+            self.x_vel *= -1
+        if self.y - ball_radius < 0:
+            self.y = ball_radius
+            self.y_vel *= -1
+
+        self.rect.center = [self.x, self.y]
+
+    # draws the ball on the screen
+    def draw(self, surface: pygame.Surface):
+        pygame.draw.circle(surface, self.color, [self.x, self.y], ball_radius)
+
+
+class Platform:
+    # Platform constructor
+    def __init__(self, x, y, width, height, speed, color=(255, 255, 255)):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.color = color
+        self.rect = pygame.Rect(x, y, width, height)
+
+    # resets the conditions of the platform to their defaults
+    def reset(self):
+        self.set_width(50)
+        self.x = 175
+        self.rect.centerx = screen_center_x
+
+    def change_width(self, inc):
+        self.rect.width += inc
+        self.width += inc
+
+    def set_width(self, w):
+        self.width = w
+        self.rect.width = w
+
+    # takes the player's inputs and moves the platform accordingly
+    def player_move(self, inputs):
+        if inputs[pygame.K_a] or inputs[pygame.K_LEFT]:
+            self.x -= platform_speed
+            self.rect = self.rect.move(-platform_speed, 0)
+        if inputs[pygame.K_d] or inputs[pygame.K_RIGHT]:
+            self.x += platform_speed
+            self.rect = self.rect.move(platform_speed, 0)
+
+        if self.rect.right > screen_dimensions[0]:
+            self.rect.right = screen_dimensions[0]
+        if self.rect.left < 0:
+            self.rect.left = 0
+
+    # draws the platform on the screen
+    def draw(self, surface: pygame.Surface):
+        pygame.draw.rect(surface, self.color, self.rect)
+
+
+# returns -1 if the parameter number is negative, 0 if it is 0, and 1 if it is positive
+def normalize(num):
+    if num > 0:
+        return 1
+    elif num < 0:
+        return -1
+    else:
+        return 0
+
+
+# takes ball and brick objects and calculates and returns the appropriate velocity for the ball.
+# meant to make the ball bounce off of platforms and bricks
+def get_new_vel(ball, norm_cords, rect, object_hit):
+    if object_hit == "platform":
+        ratio = (rect.left - ball.x) / rect.width * math.pi
+        ball.x_vel = -math.cos(ratio) * 2
+    norm_vel_cords = [normalize(ball.x_vel), normalize(ball.y_vel)]
+    dist = 0
+    for i in range(len(norm_vel_cords)):
+        if norm_vel_cords[i] != norm_cords[i]:
+            dist += 1
+    dist_arr = [0 if norm_vel_cords[i] == norm_cords[i] else 1 for i in range(len(norm_cords))]
+    match dist:
+        case 0:
+            if norm_cords[0] == -1:
+                ball.set_pos(rect.left - ball_radius, ball.y)
+            else:
+                ball.set_pos(rect.right + ball_radius, ball.y)
+            return [norm_vel_cords[0] * abs(ball.x_vel), ball.y_vel]
+        case 1:
+            if dist_arr[0] == 1:
+                if norm_cords[0] == -1:
+                    ball.set_pos(rect.left - ball_radius, ball.y)
+                else:
+                    ball.set_pos(rect.right + ball_radius, ball.y)
+                return [-norm_vel_cords[0] * abs(ball.x_vel), ball.y_vel]
+            else:
+                if norm_cords[1] == -1:
+                    ball.set_pos(ball.x, rect.top - ball_radius)
+                else:
+                    ball.set_pos(ball.x, rect.bottom + ball_radius)
+                return [ball.x_vel, -norm_vel_cords[1] * abs(ball.y_vel)]
+        case 2:
+            if abs(ball.x_vel) > .1:
+                m = ball.y_vel / ball.x_vel
+            else:
+                if norm_vel_cords[1] == 1:
+                    ball.set_pos(ball.x, rect.top - ball_radius)
+                    return [ball.x_vel, -abs(ball.y_vel)]
+                else:
+                    ball.set_pos(ball.x, rect.bottom + ball_radius)
+                    return [ball.x_vel, abs(ball.y_vel)]
+
+            match norm_vel_cords:
+                case [1, 1]:
+                    if m * (rect.left - ball.x) + ball.y > rect.top:
+                        ball.set_pos(rect.left - ball_radius, ball.y)
+                        return [-abs(ball.x_vel), ball.y_vel]
+                    else:
+                        ball.set_pos(ball.x, rect.top - ball_radius)
+                        return [ball.x_vel, -abs(ball.y_vel)]
+                case [-1, 1]:
+                    if m * (rect.right - ball.x) + ball.y < rect.top:
+                        ball.set_pos(ball.x, rect.top - ball_radius)
+                        return [ball.x_vel, -abs(ball.y_vel)]
+                    else:
+                        ball.set_pos(rect.right + ball_radius, ball.y)
+                        return [abs(ball.x_vel), ball.y_vel]
+                case [1, -1]:
+                    if m * (rect.left - ball.x) + ball.y > rect.bottom:
+                        ball.set_pos(ball.x, rect.bottom + ball_radius)
+                        return [ball.x_vel, abs(ball.y_vel)]
+                    else:
+                        ball.set_pos(rect.left - ball_radius, ball.y)
+                        return [-abs(ball.x_vel), ball.y_vel]
+                case [-1, -1]:
+                    if m * (rect.right - ball.x) + ball.y > rect.bottom:
+                        ball.set_pos(ball.x, rect.bottom + ball_radius)
+                        return [ball.x_vel, abs(ball.y_vel)]
+                    else:
+                        ball.set_pos(rect.right + ball_radius, ball.y)
+                        return [abs(ball.x_vel), ball.y_vel]
@@ -0,0 +1,147 @@
+# import libraries
+import json
+import sys
+import time
+import pygame
+
+# every key the game reads. only these keys are stored in the input log
+tracked_keys = (pygame.K_a, pygame.K_d, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_p, pygame.K_RETURN,
+                pygame.K_ESCAPE, pygame.K_s, pygame.K_e, pygame.K_c, pygame.K_0, pygame.K_1, pygame.K_2, pygame.K_3,
+                pygame.K_4, pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9)
+
+# the events whose input to display latency is measured
+timed_events = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+# the keys pressed on a replayed frame. supports the same "keys[pygame.K_x]" lookups as "pygame.key.get_pressed()"
+class ReplayKeys:
+    # ReplayKeys constructor
+    def __init__(self, pressed):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+# everything the game loop reads from the player on one frame. "event_times" holds the "time.perf_counter" time each
+# of the frame's "timed_events" was first seen at
+class FrameInput:
+    # FrameInput constructor
+    def __init__(self, keys, key_presses: list, mouse_pos: tuple, mouse_down: bool, quit_pressed: bool,
+                 event_times: list = ()):
+        self.keys = keys
+        self.key_presses = key_presses
+        self.mouse_pos = mouse_pos
+        self.mouse_down = mouse_down
+        self.quit_pressed = quit_pressed
+        self.event_times = event_times
+
+
+# reads the player's input from pygame and optionally writes every frame of it to an input log. the first line of the
+# log holds the random seed the game was started with and the "settings" that change how the game plays out, and every
+# following line holds one frame
+class LiveInput:
+    # LiveInput constructor
+    def __init__(self, seed: int, log_path: str = None, settings: dict = None):
+        self.seed = seed
+        self.settings = {} if settings is None else settings
+        self.log = None
+        if log_path is not None:
+            self.log = open(log_path, "w")
+            self.log.write(json.dumps({"seed": seed, **self.settings}) + "\n")
+        self.events = []
+
+    # moves the waiting pygame events into "events" and stamps each one with the time it was first seen. pygame events
+    # have no timestamp of their own, so calling this more often than once a frame stamps them closer to when they
+    # happened
+    def collect(self):
+        now = time.perf_counter()
+        for event in pygame.event.get():
+            self.events.append((event, now))
+
+    def poll(self):
+        self.collect()
+        key_presses = []
+        quit_pressed = False
+        event_times = []
+        for event, seen_at in self.events:
+            if event.type == pygame.QUIT:
+                quit_pressed = True
+            if event.type == pygame.KEYDOWN:
+                key_presses.append(event.key)
+            if event.type in timed_events:
+                event_times.append(seen_at)
+        self.events.clear()
+
+        frame_input = FrameInput(pygame.key.get_pressed(), key_presses, pygame.mouse.get_pos(),
+                                 pygame.mouse.get_pressed(3)[0], quit_pressed, event_times)
+
+        if self.log is not None:
+            pressed = [key for key in tracked_keys if frame_input.keys[key]]
+            self.log.write(json.dumps([pressed, key_presses, frame_input.mouse_pos, frame_input.mouse_down,
+                                       quit_pressed]) + "\n")
+        return frame_input
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+
+
+# plays the frames of an input log back in order. once the log runs out the game is told to quit. "settings" holds the
+# settings the log was recorded with. logs from before settings were recorded have none
+class ReplayInput:
+    # ReplayInput constructor
+    def __init__(self, log_path: str):
+        self.log = open(log_path, "r")
+        self.settings = json.loads(self.log.readline())
+        self.seed = self.settings.pop("seed")
+
+    def poll(self):
+        line = self.log.readline()
+        if line == "":
+            return FrameInput(ReplayKeys(()), [], (0, 0), False, True)
+
+        pressed, key_presses, mouse_pos, mouse_down, quit_pressed = json.loads(line)
+        return FrameInput(ReplayKeys(pressed), key_presses, tuple(mouse_pos), mouse_down, quit_pressed)
+
+    def close(self):
+        self.log.close()
+
+
+# streams raw frames to a file, or to stdout when the path is "-" so the frames can be piped into an encoder. frames
+# are written straight from the surface's pixel buffer without copying them into python objects first. each pixel is
+# 4 bytes in the surface's native order, e.g. for ffmpeg: -f rawvideo -pixel_format bgra -video_size WxH
+class FrameExporter:
+    # FrameExporter constructor. "frame_skip" writes every "frame_skip"th frame and "crop" is an (x, y, w, h) region
+    def __init__(self, path: str, frame_skip: int = 1, crop: tuple = None):
+        self.out = sys.stdout.buffer if path == "-" else open(path, "wb")
+        self.frame_skip = max(frame_skip, 1)
+        self.crop = None if crop is None else pygame.Rect(crop)
+        self.frame_num = 0
+        self.frames_written = 0
+
+    def write(self, surface: pygame.Surface):
+        self.frame_num += 1
+        if (self.frame_num - 1) % self.frame_skip != 0:
+            return
+
+        view = surface.get_view("1")
+        pixels = memoryview(view).cast("B")
+        if self.crop is None:
+            self.out.write(pixels)
+        else:
+            # cropped frames are written one row slice at a time, which is still a view into the surface
+            crop = self.crop.clip(surface.get_rect())
+            pitch = surface.get_pitch()
+            pixel_size = surface.get_bytesize()
+            start = crop.x * pixel_size
+            end = crop.right * pixel_size
+            self.out.writelines(pixels[y * pitch + start:y * pitch + end] for y in range(crop.top, crop.bottom))
+        pixels.release()
+        del view
+        self.frames_written += 1
+
+    def close(self):
+        self.out.flush()
+        if self.out is not sys.stdout.buffer:
+            self.out.close()
@@ -0,0 +1,208 @@
+# import libraries
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+# run history variables
+history_path = "Run-History.db"
+flat_scores_path = "Endless-High-Scores"
+schema_version = 3
+leaderboard_size = 10
+leaderboard_views = ("all time", "last 7 days", "endless", "normal levels", "custom levels")
+seconds_per_day = 24 * 60 * 60
+
+
+# creates the tables and indexes if they do not exist yet and imports the old flat high score file the first time the
+# database is opened
+def migrate(conn: sqlite3.Connection, scores_path: str = flat_scores_path):
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+    if version < 1:
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS runs ("
+                         "id INTEGER PRIMARY KEY, "
+                         "mode TEXT NOT NULL, "
+                         "score INTEGER NOT NULL, "
+                         "rounds INTEGER NOT NULL, "
+                         "outcome TEXT NOT NULL, "
+                         "duration REAL NOT NULL, "
+                         "balls_spawned INTEGER NOT NULL, "
+                         "final_layout TEXT, "
+                         "ended_at REAL NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS rounds ("
+                         "run_id INTEGER NOT NULL REFERENCES runs(id), "
+                         "round_num INTEGER NOT NULL, "
+                         "layout TEXT NOT NULL, "
+                         "bricks_broken INTEGER NOT NULL, "
+                         "balls_spawned INTEGER NOT NULL, "
+                         "duration REAL NOT NULL, "
+                         "PRIMARY KEY (run_id, round_num))")
+            conn.execute("CREATE INDEX IF NOT EXISTS runs_mode_score ON runs(mode, score DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS runs_ended_at ON runs(ended_at)")
+            conn.execute("PRAGMA user_version = 1")
+
+    # the old "Endless-High-Scores" file only kept the scores, so the imported runs are marked as "imported" and dated
+    # with the file's modification time. that is only a rough date (a fresh checkout dates every score "now"), so the
+    # time windowed views leave imported runs out
+    if version < 2:
+        imported = []
+        if os.path.exists(scores_path):
+            ended_at = os.path.getmtime(scores_path)
+            scores_file = open(scores_path, "r")
+            for line in scores_file:
+                string = "".join(char for char in line if char in "1234567890")
+                if string != "":
+                    imported.append(("endless", int(string), 0, "imported", 0, 0, None, ended_at))
+            scores_file.close()
+        with conn:
+            conn.executemany("INSERT INTO runs (mode, score, rounds, outcome, duration, balls_spawned, final_layout, "
+                             "ended_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", imported)
+            conn.execute("PRAGMA user_version = 2")
+
+    # the all time leaderboard covers every mode, so it needs an index on the score alone
+    if version < 3:
+        with conn:
+            conn.execute("CREATE INDEX IF NOT EXISTS runs_score ON runs(score DESC)")
+            conn.execute(f"PRAGMA user_version = {schema_version}")
+
+
+# opens the run history database in WAL mode so the leaderboard can be read while a run is being written
+def connect(path: str = history_path, scores_path: str = flat_scores_path):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    migrate(conn, scores_path)
+    return conn
+
+
+# writes a finished run and all of its rounds in a single transaction
+def insert_run(conn: sqlite3.Connection, run: dict):
+    with conn:
+        cursor = conn.execute("INSERT INTO runs (mode, score, rounds, outcome, duration, balls_spawned, final_layout, "
+                              "ended_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                              (run["mode"], run["score"], len(run["rounds"]), run["outcome"], run["duration"],
+                               run["balls_spawned"], run["final_layout"], run["ended_at"]))
+        run_id = cursor.lastrowid
+        conn.executemany("INSERT INTO rounds (run_id, round_num, layout, bricks_broken, balls_spawned, duration) "
+                         "VALUES (?, ?, ?, ?, ?, ?)",
+                         [(run_id, r["round_num"], r["layout"], r["bricks_broken"], r["balls_spawned"], r["duration"])
+                          for r in run["rounds"]])
+    return run_id
+
+
+# returns the top scores for one of the "leaderboard_views". every view is answered from one of the indexes on "runs"
+def query_leaderboard(conn: sqlite3.Connection, view: str, limit: int = leaderboard_size, now: float = None):
+    if now is None:
+        now = time.time()
+
+    match view:
+        case "all time":
+            rows = conn.execute("SELECT score FROM runs ORDER BY score DESC LIMIT ?", (limit,))
+        case "last 7 days":
+            rows = conn.execute("SELECT score FROM runs WHERE ended_at >= ? "
+                                "AND outcome != 'imported' ORDER BY score DESC LIMIT ?",
+                                (now - 7 * seconds_per_day, limit))
+        case "endless" | "normal levels" | "custom levels":
+            rows = conn.execute("SELECT score FROM runs WHERE mode = ? ORDER BY score DESC LIMIT ?", (view, limit))
+        case _:
+            raise ValueError(f"unknown leaderboard view: {view}")
+
+    return [row[0] for row in rows]
+
+
+# keeps the statistics of the run currently being played in memory so nothing touches the database until the run ends
+class RunRecorder:
+    # RunRecorder constructor
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.started_at = time.time()
+        self.rounds = []
+        self.balls_spawned = 0
+        self.round = None
+
+    # starts recording a new round with the layout it was spawned with
+    def start_round(self, round_num: int, layout: str):
+        self.end_round()
+        self.round = {"round_num": round_num, "layout": layout, "bricks_broken": 0, "balls_spawned": 1,
+                      "started_at": time.time()}
+        self.balls_spawned += 1
+
+    def ball_spawned(self):
+        self.balls_spawned += 1
+        if self.round is not None:
+            self.round["balls_spawned"] += 1
+
+    def brick_broken(self):
+        if self.round is not None:
+            self.round["bricks_broken"] += 1
+
+    def end_round(self):
+        if self.round is not None:
+            self.round["duration"] = time.time() - self.round.pop("started_at")
+            self.rounds.append(self.round)
+            self.round = None
+
+    # closes the current round and returns the whole run in the format "insert_run" expects
+    def finish(self, score: int, outcome: str):
+        self.end_round()
+        ended_at = time.time()
+        return {"mode": self.mode, "score": score, "outcome": outcome, "duration": ended_at - self.started_at,
+                "balls_spawned": self.balls_spawned, "rounds": self.rounds,
+                "final_layout": self.rounds[-1]["layout"] if self.rounds else None, "ended_at": ended_at}
+
+
+# owns the database connection on a background thread so writing runs and querying leaderboards never blocks a frame.
+# leaderboard results are cached and refreshed whenever a run is written
+class RunHistory:
+    # RunHistory constructor
+    def __init__(self, path: str = history_path, scores_path: str = flat_scores_path):
+        self.path = path
+        self.scores_path = scores_path
+        self.leaderboards = {}
+        self.lock = threading.Lock()
+        self.requests = queue.Queue()
+        self.thread = threading.Thread(target=self.run_worker, daemon=True)
+        self.thread.start()
+        self.refresh()
+
+    def run_worker(self):
+        conn = connect(self.path, self.scores_path)
+        while True:
+            request = self.requests.get()
+            if request is None:
+                break
+            if request[0] == "run":
+                insert_run(conn, request[1])
+            else:
+                for view in leaderboard_views:
+                    scores = query_leaderboard(conn, view)
+                    with self.lock:
+                        self.leaderboards[view] = scores
+        conn.close()
+
+    # queues a finished run to be written and the leaderboards to be re-queried afterwards
+    def submit_run(self, run: dict):
+        self.requests.put(("run", run))
+        self.refresh()
+
+    def refresh(self):
+        self.requests.put(("leaderboards",))
+
+    # returns the cached scores for the view or None if they have not been loaded yet
+    def leaderboard(self, view: str):
+        with self.lock:
+            return self.leaderboards.get(view)
+
+    # returns True if "added_score" would place on the endless leaderboard
+    def is_high_score(self, added_score: int):
+        scores = self.leaderboard("endless")
+        if scores is None:
+            return False
+        return len(scores) < leaderboard_size or added_score >= scores[-1]
+
+    # finishes any queued writes and stops the worker thread
+    def close(self):
+        self.requests.put(None)
+        self.thread.join()
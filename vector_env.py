@@ -0,0 +1,271 @@
+# import libraries
+import math
+import time
+import numpy
+import fixed_point
+import layouts
+import physics
+
+# world variables. the screen, ball and platform values come from "physics" and the rest mirror the values in "main.py"
+# so the simulated worlds behave like the real game
+screen_dimensions = physics.screen_dimensions
+block_width = screen_dimensions[0] / layouts.level_width
+block_height = block_width / 3
+ball_radius = physics.ball_radius
+ball_speed = 6
+platform_speed = physics.platform_speed
+platform_y = math.floor(screen_dimensions[1] * 15 / 16)
+default_platform_dimensions = [50, 10]
+max_platform_width = screen_dimensions[0] / 2
+powerup_chance = 4 / 11     # "spawn_powerup" draws 0 to 10 and spawns a powerup on the top four values
+num_levels = 10
+cells_per_world = layouts.max_level_height * layouts.level_width
+fixed_block_width = round(block_width * fixed_point.scale)     # a block is three times wider than it is high
+
+
+# returns "count" random grids as an array with the same distribution as "layouts.random_layout"
+def random_layouts(rng: numpy.random.Generator, count: int):
+    grids = rng.integers(-3, layouts.num_colors, (count, layouts.max_level_height, layouts.level_width))
+    num_layers = rng.integers(1, layouts.max_level_height + 1, count)
+    grids[numpy.arange(layouts.max_level_height)[None, :] >= num_layers[:, None]] = layouts.empty
+    grids[grids < 0] = layouts.empty
+    return grids.astype(numpy.int8)
+
+
+# returns the ten levels from "Maps/" as a single (10, 24, 8) array
+def read_levels(is_custom: bool = False):
+    inter = "Custom" if is_custom else ""
+    return numpy.array([layouts.read_layout(f"Maps/{inter}Level-{i}") for i in range(1, num_levels + 1)],
+                       numpy.int8)
+
+
+# steps "num_worlds" independent games at once. every piece of world state is a batched array with the world as the
+# first axis, so one call to "step" advances every world with a fixed number of numpy operations.
+#
+# the ball physics is a grid approximation of "Ball.handle_rect_bounce": each ball probes the brick cell in front of
+# it horizontally and vertically and bounces off the first brick it finds. the platform bounce uses the same cosine
+# curve as "get_new_vel".
+#
+# with "fixed" set, positions and velocities are int32 arrays in the fixed point units of "fixed_point" and the
+# platform bounce is looked up in its bounce table, so the worlds play out the same on every machine. observations are
+# then in fixed point units as well
+class VectorBreakout:
+    # VectorBreakout constructor. "mode" is "endless", "normal levels" or "custom levels"
+    def __init__(self, num_worlds: int, mode: str = "endless", max_balls: int = 8, seed: int = None,
+                 fixed: bool = False):
+        self.num_worlds = num_worlds
+        self.mode = mode
+        self.max_balls = max_balls
+        self.fixed = fixed
+        self.unit = fixed_point.scale if fixed else 1
+        dtype = numpy.int32 if fixed else numpy.float32
+        self.rng = numpy.random.default_rng(seed)
+        self.levels = None if mode == "endless" else read_levels(mode == "custom levels")
+
+        self.bricks = numpy.full((num_worlds, layouts.max_level_height, layouts.level_width), layouts.empty,
+                                 numpy.int8)
+        self.bricks_left = numpy.zeros(num_worlds, numpy.int32)
+        self.round_score = numpy.zeros(num_worlds, numpy.int32)
+        self.max_round_score = numpy.zeros(num_worlds, numpy.int32)
+        self.ball_x = numpy.zeros((num_worlds, max_balls), dtype)
+        self.ball_y = numpy.zeros((num_worlds, max_balls), dtype)
+        self.ball_x_vel = numpy.zeros((num_worlds, max_balls), dtype)
+        self.ball_y_vel = numpy.zeros((num_worlds, max_balls), dtype)
+        self.ball_active = numpy.zeros((num_worlds, max_balls), bool)
+        self.platform_x = numpy.zeros(num_worlds, dtype)
+        self.platform_width = numpy.zeros(num_worlds, dtype)
+        self.round_num = numpy.zeros(num_worlds, numpy.int32)
+        self.score = numpy.zeros(num_worlds, numpy.int32)
+        self.world_index = numpy.arange(num_worlds)
+
+        self.reset()
+
+    # returns the current state of every world. the arrays are the environment's own buffers and are only valid until
+    # the next call to "step"
+    def observe(self):
+        return {"bricks": self.bricks, "ball_x": self.ball_x, "ball_y": self.ball_y, "ball_x_vel": self.ball_x_vel,
+                "ball_y_vel": self.ball_y_vel, "ball_active": self.ball_active, "platform_x": self.platform_x,
+                "platform_width": self.platform_width, "round_num": self.round_num, "score": self.score}
+
+    # resets the worlds in the boolean mask (or every world) to the first round
+    def reset(self, worlds: numpy.ndarray = None):
+        if worlds is None:
+            worlds = numpy.ones(self.num_worlds, bool)
+        self.round_num[worlds] = 0
+        self.score[worlds] = 0
+        self.start_round(worlds)
+        return self.observe()
+
+    # spawns the next round's bricks in the masked worlds and launches a single ball from the centered platform.
+    # "grids" can hold the layouts to use instead, one for every masked world
+    def start_round(self, worlds: numpy.ndarray, grids: numpy.ndarray = None):
+        indexes = numpy.flatnonzero(worlds)
+        if len(indexes) == 0:
+            return
+
+        self.round_num[indexes] += 1
+        if grids is not None:
+            self.bricks[indexes] = grids
+        elif self.levels is None:
+            self.bricks[indexes] = random_layouts(self.rng, len(indexes))
+        else:
+            self.bricks[indexes] = self.levels[numpy.minimum(self.round_num[indexes], num_levels) - 1]
+        self.bricks_left[indexes] = numpy.count_nonzero(self.bricks[indexes] != layouts.empty, axis=(1, 2))
+
+        # like "Session.load_bricks", a normal level ends after "round * 8" bricks and other rounds once every brick
+        # is broken
+        self.round_score[indexes] = 0
+        if self.mode == "normal levels":
+            self.max_round_score[indexes] = self.round_num[indexes] * layouts.level_width
+        else:
+            self.max_round_score[indexes] = self.bricks_left[indexes]
+
+        self.platform_x[indexes] = screen_dimensions[0] // 2 * self.unit
+        self.platform_width[indexes] = default_platform_dimensions[0] * self.unit
+        self.ball_active[indexes] = False
+        self.ball_active[indexes, 0] = True
+        self.ball_x[indexes, 0] = self.platform_x[indexes]
+        self.ball_y[indexes, 0] = (platform_y - ball_radius) * self.unit
+        self.ball_x_vel[indexes, 0] = 0
+        self.ball_y_vel[indexes, 0] = -ball_speed * self.unit
+
+    # moves the platforms by "actions" (-1 left, 0 stay, 1 right), advances every ball one frame and auto-resets the
+    # worlds that have finished. returns the observations, the bricks broken in each world and the worlds that ended
+    def step(self, actions: numpy.ndarray):
+        unit = self.unit
+        radius = ball_radius * unit
+        width = screen_dimensions[0] * unit
+
+        # platform movement
+        half_width = self.platform_width // 2 if self.fixed else self.platform_width / 2
+        self.platform_x += numpy.clip(actions, -1, 1).astype(self.platform_x.dtype) * (platform_speed * unit)
+        numpy.clip(self.platform_x, half_width, width - half_width, out=self.platform_x)
+
+        # ball movement and wall bounces
+        active = self.ball_active
+        self.ball_x += self.ball_x_vel * active
+        self.ball_y += self.ball_y_vel * active
+        left_wall = self.ball_x < radius
+        right_wall = self.ball_x > width - radius
+        top_wall = self.ball_y < radius
+        self.ball_x[left_wall] = radius
+        self.ball_x[right_wall] = width - radius
+        self.ball_y[top_wall] = radius
+        self.ball_x_vel[left_wall | right_wall] *= -1
+        self.ball_y_vel[top_wall] *= -1
+
+        # platform bounce
+        platform_left = (self.platform_x - half_width)[:, None]
+        platform_width = self.platform_width[:, None]
+        on_platform = (active & (self.ball_y_vel > 0)
+                       & (self.ball_y + radius >= platform_y * unit)
+                       & (self.ball_y - radius <= (platform_y + default_platform_dimensions[1]) * unit)
+                       & (self.ball_x + radius >= platform_left)
+                       & (self.ball_x - radius <= platform_left + platform_width))
+        if self.fixed:
+            offsets = (self.ball_x - platform_left)[on_platform]
+            widths = numpy.broadcast_to(platform_width, on_platform.shape)[on_platform]
+            self.ball_x_vel[on_platform] = fixed_point.bounce_velocities(offsets, widths)
+        else:
+            ratio = (platform_left - self.ball_x) / platform_width * math.pi
+            self.ball_x_vel[on_platform] = -numpy.cos(ratio[on_platform]) * 2
+        self.ball_y_vel[on_platform] *= -1
+        self.ball_y[on_platform] = (platform_y - ball_radius) * unit
+
+        # brick collisions
+        rewards = self.break_bricks(active)
+
+        # balls that fall below the screen are lost
+        self.ball_active &= self.ball_y <= screen_dimensions[1] * unit
+
+        # progresses rounds, ends games and auto-resets the worlds that ended. like "RoundRunningScene.update", a world
+        # that finishes its round goes on even if it lost its last ball on the same step, and every mode is won after
+        # "num_levels" rounds
+        cleared = self.round_score >= self.max_round_score
+        won = cleared & (self.round_num >= num_levels)
+        dones = (~self.ball_active.any(axis=1) & ~cleared) | won
+        self.start_round(cleared & ~won)
+        if dones.any():
+            self.reset(dones)
+
+        return self.observe(), rewards, dones
+
+    # bounces every active ball off the first brick cell in front of it, removes the bricks that were hit, rolls the
+    # powerups for each hit and returns how many bricks were broken in each world
+    def break_bricks(self, active: numpy.ndarray):
+        flat_bricks = self.bricks.reshape(-1)
+        world_offset = (self.world_index * cells_per_world)[:, None]
+
+        radius = ball_radius * self.unit
+        vertical = self.probe(self.ball_x, self.ball_y + numpy.sign(self.ball_y_vel) * radius, active)
+        horizontal = self.probe(self.ball_x + numpy.sign(self.ball_x_vel) * radius, self.ball_y,
+                                active & (vertical < 0))
+        hit_cells = numpy.where(vertical >= 0, vertical, horizontal)
+        hits = hit_cells >= 0
+        self.ball_y_vel[vertical >= 0] *= -1
+        self.ball_x_vel[horizontal >= 0] *= -1
+
+        # several balls can hit the same brick in one step, but it only counts once
+        broken = numpy.unique((hit_cells + world_offset)[hits])
+        flat_bricks[broken] = layouts.empty
+        rewards = numpy.bincount(broken // cells_per_world, minlength=self.num_worlds).astype(numpy.int32)
+        self.bricks_left -= rewards
+        self.round_score += rewards
+        self.score += rewards
+
+        self.spawn_powerups(hits.sum(axis=1))
+        return rewards
+
+    # returns the flat cell index of the brick at each probe point, or -1 where there is no brick
+    def probe(self, x: numpy.ndarray, y: numpy.ndarray, mask: numpy.ndarray):
+        if self.fixed:
+            col = x // fixed_block_width
+            row = y * 3 // fixed_block_width
+        else:
+            col = numpy.floor(x / block_width).astype(numpy.int32)
+            row = numpy.floor(y / block_height).astype(numpy.int32)
+        mask = mask & (col >= 0) & (col < layouts.level_width) & (row >= 0) & (row < layouts.max_level_height)
+        cells = numpy.where(mask, row * layouts.level_width + col, 0)
+        present = mask & (numpy.take_along_axis(self.bricks.reshape(self.num_worlds, -1), cells, axis=1)
+                          != layouts.empty)
+        return numpy.where(present, cells, -1)
+
+    # rolls a powerup for every brick hit like "spawn_powerup". a world gets at most one extra ball per step
+    def spawn_powerups(self, hit_counts: numpy.ndarray):
+        rolls = self.rng.random((2, self.num_worlds))
+        chance = 1 - (1 - powerup_chance) ** hit_counts
+        powered = rolls[0] < chance
+        extra_ball = powered & (rolls[1] < 0.5) & ~self.ball_active.all(axis=1)
+        long_platform = powered & ~extra_ball
+
+        self.platform_width[long_platform] = numpy.minimum(self.platform_width[long_platform] + 5 * self.unit,
+                                                           max_platform_width * self.unit)
+
+        worlds = numpy.flatnonzero(extra_ball)
+        slots = numpy.argmin(self.ball_active[worlds], axis=1)
+        self.ball_active[worlds, slots] = True
+        self.ball_x[worlds, slots] = self.platform_x[worlds]
+        self.ball_y[worlds, slots] = (platform_y - default_platform_dimensions[1] // 2 - ball_radius) * self.unit
+        self.ball_x_vel[worlds, slots] = 0
+        self.ball_y_vel[worlds, slots] = -ball_speed * self.unit
+
+
+# measures the throughput of the float and fixed point environments with a scripted paddle that follows the lowest
+# ball
+if __name__ == "__main__":
+    for fixed in (False, True):
+        env = VectorBreakout(4096, seed=0, fixed=fixed)
+        steps = 500
+        broken = 0
+        games = 0
+        start = time.perf_counter()
+        for i in range(steps):
+            obs = env.observe()
+            lowest = numpy.argmax(numpy.where(obs["ball_active"], obs["ball_y"], -1), axis=1)
+            target = obs["ball_x"][env.world_index, lowest]
+            _, rewards, dones = env.step(numpy.sign(target - obs["platform_x"]))
+            broken += int(rewards.sum())
+            games += int(dones.sum())
+        elapsed = time.perf_counter() - start
+        print(f"{'fixed point' if fixed else 'float'}: {env.num_worlds * steps / elapsed:,.0f} world-steps per second, "
+              f"{broken} bricks broken, {games} games finished")